@@ -1,22 +1,28 @@
 #!/usr/bin/env python3
 
 import os
+import stat
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import click
 from dotenv import load_dotenv
 from rich.console import Console
-from rich.table import Table
 from rich.prompt import Prompt
 
 from src.metadata_extractor import MetadataExtractor, VideoMetadata
-from src.youtube_uploader import YouTubeUploader
-from src.peertube_uploader import PeerTubeUploader
-from src.upload_orchestrator import UploadOrchestrator
 from src.metadata_manager import MetadataManager
-from src.course_yml_updater import CourseYmlUpdater
+from src.rate_limiter import AdaptiveConcurrencyLimiter, TokenBucket
+
+# Upload modules pull in the Google API client and requests stacks, so they are
+# only imported once the user actually gets to the upload step
+if TYPE_CHECKING:
+    from src.upload_orchestrator import UploadOrchestrator, UploadResult
 
 # Load environment variables
 load_dotenv()
@@ -24,8 +30,62 @@ load_dotenv()
 console = Console()
 
 
+@dataclass(frozen=True, slots=True)
+class UploadConfig:
+    """Platform credentials and options read once from the environment"""
+    youtube_client_secrets_file: Optional[str] = None
+    peertube_instance: Optional[str] = None
+    peertube_username: Optional[str] = None
+    peertube_password: Optional[str] = None
+    peertube_upload_endpoint: Optional[str] = None
+    peertube_verify_ssl: bool = True
+
+    @classmethod
+    def from_env(cls) -> 'UploadConfig':
+        """Build the config from environment variables (.env is already loaded)"""
+        env = os.environ
+        return cls(
+            youtube_client_secrets_file=env.get('YOUTUBE_CLIENT_SECRETS_FILE'),
+            peertube_instance=env.get('PEERTUBE_INSTANCE'),
+            peertube_username=env.get('PEERTUBE_USERNAME'),
+            peertube_password=env.get('PEERTUBE_PASSWORD'),
+            peertube_upload_endpoint=env.get('PEERTUBE_UPLOAD_ENDPOINT'),
+            peertube_verify_ssl=env.get('PEERTUBE_VERIFY_SSL', 'true').lower() == 'true'
+        )
+
+    @property
+    def youtube_configured(self) -> bool:
+        """YouTube needs an existing OAuth2 client secrets file"""
+        return bool(self.youtube_client_secrets_file) and Path(self.youtube_client_secrets_file).exists()
+
+    @property
+    def peertube_configured(self) -> bool:
+        """PeerTube needs an instance URL and account credentials"""
+        return bool(self.peertube_instance and self.peertube_username and self.peertube_password)
+
+
+# SHA256 cache kept next to metadata.json
+HASH_CACHE_FILENAME = ".hash_cache.json"
+
+# PeerTube uploads refused with 429/503 are retried this many times
+PEERTUBE_OVERLOAD_RETRIES = 3
+
+# Fields shown for each video, fetched in a single C-level call per metadata
+METADATA_ROW_FIELDS = attrgetter(
+    'filename', 'title', 'code_language', 'course_title', 'description',
+    'course_index', 'part_index', 'chapter_index', 'chapter_title', 'sha256_hash'
+)
+RESULT_ROW_FIELDS = attrgetter(
+    'filename', 'youtube_success', 'peertube_success', 'youtube_url', 'peertube_url',
+    'youtube_error', 'peertube_error'
+)
+
+
 def display_metadata_table(metadata_list: List[VideoMetadata]):
     """Display metadata in a formatted table"""
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Video Metadata Extraction Results")
 
     table.add_column("Filename", style="cyan", no_wrap=False)
@@ -33,83 +93,335 @@ def display_metadata_table(metadata_list: List[VideoMetadata]):
     table.add_column("Language", style="yellow")
     table.add_column("Course", style="blue")
 
-    for metadata in metadata_list:
-        table.add_row(
-            metadata.filename,
-            metadata.title,
-            metadata.code_language,
-            metadata.course_title
-        )
+    rows = [METADATA_ROW_FIELDS(metadata) for metadata in metadata_list]
+
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row[:4])
 
     console.print(table)
 
-    # Also display full details
-    console.print("\n[bold]Detailed Information:[/bold]")
-    for metadata in metadata_list:
-        console.print(f"\n[cyan]File:[/cyan] {metadata.filename}")
-        console.print(f"  [green]Title:[/green] {metadata.title}")
-        console.print(f"  [yellow]Description:[/yellow] {metadata.description}")
-        console.print(f"  [blue]Course:[/blue] {metadata.course_index} - {metadata.course_title}")
-        console.print(f"  [magenta]Chapter:[/magenta] Part {metadata.part_index}, Chapter {metadata.chapter_index} - {metadata.chapter_title}")
-        console.print(f"  [red]Language:[/red] {metadata.code_language}")
-        if metadata.sha256_hash:
-            console.print(f"  [dim]SHA256:[/dim] {metadata.sha256_hash}")
+    # Also display full details, rendered as a single styled block
+    out = Text("\nDetailed Information:\n", style="bold")
+    append = out.append
+    for (filename, title, code_language, course_title, description,
+         course_index, part_index, chapter_index, chapter_title, sha256_hash) in rows:
+        append("\nFile:", style="cyan")
+        append(f" {filename}\n  ")
+        append("Title:", style="green")
+        append(f" {title}\n  ")
+        append("Description:", style="yellow")
+        append(f" {description}\n  ")
+        append("Course:", style="blue")
+        append(f" {course_index} - {course_title}\n  ")
+        append("Chapter:", style="magenta")
+        append(f" Part {part_index}, Chapter {chapter_index} - {chapter_title}\n  ")
+        append("Language:", style="red")
+        append(f" {code_language}\n")
+        if sha256_hash:
+            append("  SHA256:", style="dim")
+            append(f" {sha256_hash}\n")
+    out.rstrip()
+    console.print(out)
 
 
 def display_upload_results(results):
     """Display upload results in a formatted table"""
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(title="Upload Results")
 
     table.add_column("Filename", style="cyan", no_wrap=False)
     table.add_column("YouTube", style="green")
     table.add_column("PeerTube", style="blue")
 
-    for result in results:
-        youtube_status = "✅" if result.youtube_success else "❌"
-        peertube_status = "✅" if result.peertube_success else "❌"
+    rows = [RESULT_ROW_FIELDS(result) for result in results]
 
-        table.add_row(
-            result.filename,
-            youtube_status,
-            peertube_status
+    add_row = table.add_row
+    for filename, youtube_success, peertube_success, *_ in rows:
+        add_row(
+            filename,
+            "✅" if youtube_success else "❌",
+            "✅" if peertube_success else "❌"
         )
 
     console.print(table)
 
-    # Display URLs for successful uploads
-    console.print("\n[bold]Uploaded Videos:[/bold]")
-    for result in results:
-        if result.youtube_success or result.peertube_success:
-            console.print(f"\n[cyan]{result.filename}[/cyan]")
-            if result.youtube_success:
-                console.print(f"  [green]YouTube:[/green] {result.youtube_url}")
-            if result.peertube_success:
-                console.print(f"  [blue]PeerTube:[/blue] {result.peertube_url}")
-
-    # Display errors
-    errors = [r for r in results if not r.youtube_success or not r.peertube_success]
+    # Display URLs for successful uploads and errors, rendered as a single block
+    out = Text("\nUploaded Videos:\n", style="bold")
+    errors = []
+    append, add_error = out.append, errors.append
+    for filename, youtube_success, peertube_success, youtube_url, peertube_url, \
+            youtube_error, peertube_error in rows:
+        if youtube_success or peertube_success:
+            append(f"\n{filename}\n", style="cyan")
+            if youtube_success:
+                append("  YouTube:", style="green")
+                append(f" {youtube_url}\n")
+            if peertube_success:
+                append("  PeerTube:", style="blue")
+                append(f" {peertube_url}\n")
+
+        if not youtube_success:
+            add_error(f"  YouTube - {filename}: {youtube_error}")
+        if not peertube_success:
+            add_error(f"  PeerTube - {filename}: {peertube_error}")
+
     if errors:
-        console.print("\n[bold red]Errors:[/bold red]")
-        for result in errors:
-            if not result.youtube_success:
-                console.print(f"  YouTube - {result.filename}: {result.youtube_error}")
-            if not result.peertube_success:
-                console.print(f"  PeerTube - {result.filename}: {result.peertube_error}")
+        append("\nErrors:\n", style="bold red")
+        append("\n".join(errors))
+
+    out.rstrip()
+    console.print(out)
+
+
+def display_upload_plan(orchestrator: 'UploadOrchestrator', video_folder: Path,
+                        metadata_list: List[VideoMetadata], metadata_manager: MetadataManager,
+                        upload_to_youtube: bool, upload_to_peertube: bool,
+                        peertube_only_mode: bool):
+    """Display what an upload run would do for each video, without uploading"""
+    from rich.table import Table
+
+    table = Table(title="Upload Plan (dry run)")
+
+    table.add_column("Filename", style="cyan", no_wrap=False)
+    table.add_column("YouTube", style="green")
+    table.add_column("PeerTube", style="blue")
+
+    def describe(upload: bool, old_id: Optional[str]) -> str:
+        if not upload:
+            return "-"
+        return f"replace {old_id}" if old_id else "upload"
+
+    counts = {"upload": 0, "skip": 0}
+    add_row = table.add_row
+    planned_hashes = set()
+    for metadata in metadata_list:
+        plan = orchestrator.plan_upload(
+            video_folder=video_folder,
+            metadata=metadata,
+            metadata_manager=metadata_manager,
+            upload_to_youtube=upload_to_youtube,
+            upload_to_peertube=upload_to_peertube,
+            peertube_only_mode=peertube_only_mode,
+            planned_hashes=planned_hashes
+        )
+
+        if plan.skip_result:
+            counts["skip"] += 1
+            add_row(
+                metadata.filename,
+                f"skip ({plan.skip_result.youtube_error})",
+                f"skip ({plan.skip_result.peertube_error})"
+            )
+            continue
+
+        counts["upload"] += 1
+        add_row(
+            metadata.filename,
+            describe(plan.upload_to_youtube, plan.old_youtube_id),
+            describe(plan.upload_to_peertube, plan.old_peertube_id)
+        )
+
+    console.print(table)
+    console.print(f"\n[bold]Would upload:[/bold] {counts['upload']} videos, [bold]skip:[/bold] {counts['skip']} videos")
+
+
+def upload_concurrently(orchestrator: 'UploadOrchestrator', video_folder: Path,
+                        metadata_list: List[VideoMetadata], metadata_manager: MetadataManager,
+                        upload_to_youtube: bool, upload_to_peertube: bool,
+                        peertube_only_mode: bool, youtube_workers: int,
+                        peertube_workers: int,
+                        youtube_limiter: TokenBucket,
+                        peertube_limiter: AdaptiveConcurrencyLimiter) -> List['UploadResult']:
+    """
+    Upload videos with one worker pool per platform
+
+    Upload decisions are made sequentially first, then every (video, platform)
+    pair is submitted to its platform pool so a slow platform doesn't gate the
+    other one. YouTube uploads additionally wait on a token bucket so bursts
+    of concurrent uploads don't trip YouTube's spam detection. PeerTube uploads
+    run under an adaptive concurrency limit that shrinks when the instance
+    answers 429/503 (those uploads are retried) and grows back on success.
+    Once all uploads of a video are done its metadata is appended
+    to the metadata.jsonl journal; metadata.json and the course.yml files are
+    rewritten once at the end.
+    """
+    from src.upload_orchestrator import UploadResult
 
+    def run_youtube_upload(*args):
+        with youtube_limiter:
+            orchestrator.upload_to_youtube(*args)
 
-def get_subfolders(base_path: Path) -> List[str]:
-    """Get list of subfolders in the inputs directory"""
-    if not base_path.exists():
+    def run_peertube_upload(metadata, video_path, result, old_peertube_id):
+        for attempt in range(PEERTUBE_OVERLOAD_RETRIES + 1):
+            peertube_limiter.acquire()
+            pt_result = None
+            try:
+                pt_result = orchestrator.upload_to_peertube(metadata, video_path, result, old_peertube_id)
+            finally:
+                overloaded = pt_result is not None and pt_result.overloaded
+                peertube_limiter.release(overloaded)
+
+            if not overloaded or attempt == PEERTUBE_OVERLOAD_RETRIES:
+                return
+            # The old video was already deleted by the first attempt
+            old_peertube_id = None
+            time.sleep(pt_result.retry_after or 2 ** (attempt + 2))
+
+    plans = []
+    # Nothing is recorded in metadata.json until uploads finish, so duplicate
+    # content within the batch is caught here instead of by find_by_hash
+    planned_hashes = set()
+    for i, metadata in enumerate(metadata_list, 1):
+        print(f"\n[{i}/{len(metadata_list)}] Planning: {metadata.filename}")
+        plans.append(orchestrator.plan_upload(
+            video_folder=video_folder,
+            metadata=metadata,
+            metadata_manager=metadata_manager,
+            upload_to_youtube=upload_to_youtube,
+            upload_to_peertube=upload_to_peertube,
+            peertube_only_mode=peertube_only_mode,
+            planned_hashes=planned_hashes
+        ))
+
+    results = []
+    uploaded = []
+    pending = []
+    futures = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=youtube_workers) as youtube_pool, \
+                ThreadPoolExecutor(max_workers=peertube_workers) as peertube_pool:
+            for index, plan in enumerate(plans):
+                pending.append(0)
+
+                if plan.skip_result:
+                    results.append(plan.skip_result)
+                    continue
+
+                result = UploadResult(
+                    filename=plan.metadata.filename,
+                    title=plan.metadata.title,
+                    youtube_success=False,
+                    peertube_success=False
+                )
+                results.append(result)
+
+                if plan.upload_to_youtube:
+                    future = youtube_pool.submit(run_youtube_upload, plan.metadata,
+                                                 plan.video_path, result, plan.old_youtube_id)
+                    futures[future] = (index, 'youtube')
+                    pending[index] += 1
+
+                if plan.upload_to_peertube:
+                    future = peertube_pool.submit(run_peertube_upload, plan.metadata,
+                                                  plan.video_path, result, plan.old_peertube_id)
+                    futures[future] = (index, 'peertube')
+                    pending[index] += 1
+
+            for future in as_completed(futures):
+                index, platform = futures[future]
+                plan, result = plans[index], results[index]
+
+                try:
+                    future.result()
+                except Exception as e:
+                    if platform == 'youtube':
+                        result.youtube_error = f"Upload failed: {e}"
+                    else:
+                        result.peertube_error = f"Upload failed: {e}"
+
+                pending[index] -= 1
+                if pending[index] == 0 and (result.youtube_success or result.peertube_success):
+                    # Every platform is done with this video: journal it right away
+                    metadata_manager.append(plan.metadata)
+                    uploaded.append(plan.metadata)
+    finally:
+        if uploaded:
+            # Compact the metadata.jsonl journal into metadata.json once per batch
+            metadata_manager.save(list(metadata_manager.metadata_dict.values()))
+        # Each course.yml is rewritten once for all of its uploaded videos
+        orchestrator.update_course_ymls(uploaded)
+
+    return results
+
+
+def is_directory(path: Path) -> bool:
+    """Check that a path exists and is a directory with a single stat call"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def ensure_dir(path: Path) -> bool:
+    """
+    Make sure a directory exists, checking it with a single stat call
+
+    Returns:
+        True if the path was already a directory, False if it had to be created
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        os.makedirs(path)
+        return False
+
+    if not stat.S_ISDIR(st.st_mode):
+        raise NotADirectoryError(f"{path} exists but is not a directory")
+    return True
+
+
+def count_videos(folder: str) -> int:
+    """Count .mp4 files in a folder the way glob("*.mp4") matches them, without building Paths"""
+    count = 0
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.endswith('.mp4') and not name.startswith('.') and entry.is_file():
+                count += 1
+    return count
+
+
+def get_subfolders(base_path: Path) -> List[Tuple[str, Path, int]]:
+    """Get sorted list of (subfolder name, subfolder path, mp4 count) in the inputs directory"""
+    subfolders = []
+    try:
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                subfolders.append((entry.name, Path(entry.path), count_videos(entry.path)))
+    except FileNotFoundError:
         return []
 
-    subfolders = [d.name for d in base_path.iterdir() if d.is_dir()]
     return sorted(subfolders)
 
 
 @click.command()
 @click.option('--bec-repo', envvar='BEC_REPO', help='Path to Bitcoin Education Content repository')
 @click.option('--input-dir', default='./inputs', help='Path to inputs directory containing video folders')
-def main(bec_repo: str, input_dir: str):
+@click.option('--upload-concurrency', envvar='UPLOAD_WORKERS', default=4, show_default=True,
+              type=click.IntRange(min=1), help='Number of concurrent YouTube uploads')
+@click.option('--peertube-concurrency', envvar='PEERTUBE_UPLOAD_WORKERS', default=20, show_default=True,
+              type=click.IntRange(min=1), help='Number of concurrent PeerTube uploads')
+@click.option('--input-choice', type=click.IntRange(min=1), default=None,
+              help='Number of the subfolder to process (skips the prompt)')
+@click.option('--upload/--no-upload', default=None,
+              help='Upload without confirmation prompts, or stop after metadata extraction')
+@click.option('--platform', type=click.Choice(['both', 'youtube', 'peertube', 'peertube-only']), default=None,
+              help='Upload platform(s) (skips the strategy and platform prompts)')
+@click.option('--dry-run', is_flag=True, default=False,
+              help='Show what would be uploaded, replaced or skipped without uploading anything')
+@click.option('--verify-hashes', is_flag=True, default=False,
+              help='Re-read every video to compute its SHA256 instead of trusting unchanged size and mtime')
+@click.option('--youtube-uploads-per-minute', default=2.0, show_default=True, type=click.FloatRange(min=0, min_open=True),
+              help='Sustained YouTube upload rate (bursts up to --upload-concurrency)')
+def main(bec_repo: str, input_dir: str, upload_concurrency: int, peertube_concurrency: int,
+         input_choice: Optional[int], upload: Optional[bool], platform: Optional[str],
+         dry_run: bool, verify_hashes: bool, youtube_uploads_per_minute: float):
     """
     Automatic Video Uploader - Metadata Extraction Component
 
@@ -117,6 +429,8 @@ def main(bec_repo: str, input_dir: str):
     """
     console.print("[bold blue]🎥 Automatic Video Uploader - Metadata Extraction[/bold blue]\n")
 
+    config = UploadConfig.from_env()
+
     # Check if BEC_REPO is set
     if not bec_repo:
         console.print("[red]Error: BEC_REPO environment variable is not set![/red]")
@@ -124,16 +438,19 @@ def main(bec_repo: str, input_dir: str):
         sys.exit(1)
 
     # Check if BEC repo exists
-    if not Path(bec_repo).exists():
+    if not is_directory(bec_repo):
         console.print(f"[red]Error: Bitcoin Education Content repository not found at {bec_repo}[/red]")
         sys.exit(1)
 
     # Check inputs directory
     input_path = Path(input_dir)
-    if not input_path.exists():
-        console.print(f"[yellow]Warning: Inputs directory not found at {input_path}[/yellow]")
-        console.print("Creating inputs directory...")
-        input_path.mkdir(parents=True, exist_ok=True)
+    try:
+        if not ensure_dir(input_path):
+            console.print(f"[yellow]Warning: Inputs directory not found at {input_path}[/yellow]")
+            console.print("Created inputs directory")
+    except NotADirectoryError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        sys.exit(1)
 
     # Get list of subfolders
     subfolders = get_subfolders(input_path)
@@ -145,25 +462,28 @@ def main(bec_repo: str, input_dir: str):
 
     # Display available subfolders
     console.print("[bold]Available subfolders:[/bold]")
-    for i, folder in enumerate(subfolders, 1):
-        # Count video files in each folder
-        video_count = len(list((input_path / folder).glob("*.mp4")))
+    for i, (folder, _, video_count) in enumerate(subfolders, 1):
         console.print(f"  {i}. {folder} ({video_count} videos)")
 
-    # Ask user to select a subfolder
-    console.print("")
-    try:
-        choice = Prompt.ask(
-            "Select a subfolder to process",
-            choices=[str(i) for i in range(1, len(subfolders) + 1)],
-            default="1"
-        )
-    except (EOFError, KeyboardInterrupt):
-        console.print("\n[yellow]Operation cancelled[/yellow]")
-        sys.exit(0)
+    # Ask user to select a subfolder (unless given with --input-choice)
+    if input_choice is not None:
+        if input_choice > len(subfolders):
+            console.print(f"[red]Error: --input-choice {input_choice} is out of range (1-{len(subfolders)})[/red]")
+            sys.exit(1)
+        choice = str(input_choice)
+    else:
+        console.print("")
+        try:
+            choice = Prompt.ask(
+                "Select a subfolder to process",
+                choices=[str(i) for i in range(1, len(subfolders) + 1)],
+                default="1"
+            )
+        except (EOFError, KeyboardInterrupt):
+            console.print("\n[yellow]Operation cancelled[/yellow]")
+            sys.exit(0)
 
-    selected_folder = subfolders[int(choice) - 1]
-    selected_path = input_path / selected_folder
+    selected_folder, selected_path, _ = subfolders[int(choice) - 1]
 
     console.print(f"\n[green]Processing videos in: {selected_path}[/green]\n")
 
@@ -176,14 +496,29 @@ def main(bec_repo: str, input_dir: str):
 
     # Load existing metadata from metadata.json
     metadata_manager = MetadataManager()
-    existing_metadata = metadata_manager.load()
+    metadata_manager.load()
+
+    # Reuse SHA256 results of previous runs for unchanged videos
+    hash_cache_file = metadata_manager.metadata_file.parent / HASH_CACHE_FILENAME
+    extractor.load_hash_cache(hash_cache_file)
+    extractor.fast_stat_mode = not verify_hashes
 
     # Process videos in selected folder
-    metadata_list = extractor.process_videos_in_folder(selected_path)
+    metadata_list = extractor.process_videos_in_folder(
+        selected_path,
+        cache=metadata_manager.metadata_dict,
+        cache_mtime=metadata_manager.loaded_mtime
+    )
+    extractor.save_hash_cache(hash_cache_file)
 
     if metadata_list:
         console.print(f"\n[green]✅ Successfully processed {len(metadata_list)} videos[/green]")
 
+        if upload is False:
+            display_metadata_table(metadata_list)
+            console.print("\n[yellow]Skipping upload (--no-upload)[/yellow]")
+            return
+
         # Check for videos without video_id (needed for course.yml update)
         videos_without_id = [m for m in metadata_list if not m.video_id]
 
@@ -201,17 +536,20 @@ def main(bec_repo: str, input_dir: str):
             console.print("  • The BEC repository won't link to these videos")
             console.print("\n[dim]To fix: Add :::video id=UUID::: tags to the corresponding chapters in the BEC repo[/dim]")
 
-            # Ask user if they want to continue
-            console.print("")
-            try:
-                continue_choice = Prompt.ask(
-                    "Do you want to continue with the upload anyway?",
-                    choices=["yes", "no"],
-                    default="no"
-                )
-            except (EOFError, KeyboardInterrupt):
-                console.print("\n[yellow]Operation cancelled[/yellow]")
-                sys.exit(0)
+            # Ask user if they want to continue (--upload and --dry-run already answer yes)
+            if upload or dry_run:
+                continue_choice = "yes"
+            else:
+                console.print("")
+                try:
+                    continue_choice = Prompt.ask(
+                        "Do you want to continue with the upload anyway?",
+                        choices=["yes", "no"],
+                        default="no"
+                    )
+                except (EOFError, KeyboardInterrupt):
+                    console.print("\n[yellow]Operation cancelled[/yellow]")
+                    sys.exit(0)
 
             if continue_choice == "no":
                 console.print("[yellow]Upload cancelled. Please add video IDs to the BEC repository first.[/yellow]")
@@ -224,110 +562,132 @@ def main(bec_repo: str, input_dir: str):
         console.print(f"\n[blue]📤 Processing {len(metadata_list)} videos for upload:[/blue]")
 
         # Check which platforms are configured
-        youtube_configured = False
-        peertube_configured = False
-
-        # Check YouTube credentials
-        youtube_client_secrets = os.getenv('YOUTUBE_CLIENT_SECRETS_FILE')
-        if youtube_client_secrets and Path(youtube_client_secrets).exists():
-            youtube_configured = True
-
-        # Check PeerTube credentials
-        peertube_instance = os.getenv('PEERTUBE_INSTANCE')
-        peertube_username = os.getenv('PEERTUBE_USERNAME')
-        peertube_password = os.getenv('PEERTUBE_PASSWORD')
-        if peertube_instance and peertube_username and peertube_password:
-            peertube_configured = True
+        youtube_configured = config.youtube_configured
+        peertube_configured = config.peertube_configured
 
         if not youtube_configured and not peertube_configured:
             console.print("[red]No platform credentials configured. Cannot upload.[/red]")
             console.print("Please configure credentials in .env file.")
             sys.exit(1)
 
-        # Ask user about provider strategy first
-        provider_strategy = "both"  # default
-        if youtube_configured and peertube_configured:
-            console.print("\n[bold]Select provider strategy:[/bold]")
-            console.print("  1. Consider both YouTube and PeerTube for uploads")
-            console.print("  2. Consider only PeerTube for uploads")
-            console.print("")
+        if platform is not None:
+            # Platform given on the command line, skip the strategy and platform prompts
+            needs_youtube = platform in ("both", "youtube")
+            needs_peertube = platform != "youtube"
+            if (needs_youtube and not youtube_configured) or (needs_peertube and not peertube_configured):
+                console.print(f"[red]--platform {platform} requires credentials that are not configured.[/red]")
+                sys.exit(1)
 
-            try:
-                strategy_choice = Prompt.ask(
-                    "Select strategy",
-                    choices=["1", "2"],
-                    default="1"
-                )
-            except (EOFError, KeyboardInterrupt):
-                console.print("\n[yellow]Operation cancelled[/yellow]")
-                sys.exit(0)
-
-            if strategy_choice == "2":
+            if platform == "peertube-only":
                 provider_strategy = "peertube_only"
-                console.print("[yellow]→ Will only consider PeerTube for uploads (YouTube will be ignored)[/yellow]")
+                selected_platform = "peertube"
             else:
                 provider_strategy = "both"
-                console.print("[green]→ Will consider both providers for uploads[/green]")
-
-        # Now determine which platforms to actually use based on strategy
-        if provider_strategy == "peertube_only":
-            # Force PeerTube only, even if YouTube is configured
-            selected_platform = "peertube"
+                selected_platform = platform
         else:
-            # Original logic for platform selection
-            console.print("\n[bold]Select upload platform(s):[/bold]")
-            platform_choices = []
-            choice_map = {}
-            choice_num = 1
-
+            # Ask user about provider strategy first
+            provider_strategy = "both"  # default
             if youtube_configured and peertube_configured:
-                console.print(f"  {choice_num}. Both YouTube and PeerTube")
-                choice_map[str(choice_num)] = "both"
-                platform_choices.append(str(choice_num))
-                choice_num += 1
-
-            if youtube_configured:
-                console.print(f"  {choice_num}. YouTube only")
-                choice_map[str(choice_num)] = "youtube"
-                platform_choices.append(str(choice_num))
-                choice_num += 1
-
-            if peertube_configured:
-                console.print(f"  {choice_num}. PeerTube only")
-                choice_map[str(choice_num)] = "peertube"
-                platform_choices.append(str(choice_num))
-                choice_num += 1
-
-            console.print("")
-            try:
-                platform_choice = Prompt.ask(
-                    "Select platform",
-                    choices=platform_choices,
-                    default="1"
-                )
-            except (EOFError, KeyboardInterrupt):
-                console.print("\n[yellow]Operation cancelled[/yellow]")
-                sys.exit(0)
+                console.print("\n[bold]Select provider strategy:[/bold]")
+                console.print("  1. Consider both YouTube and PeerTube for uploads")
+                console.print("  2. Consider only PeerTube for uploads")
+                console.print("")
+
+                try:
+                    strategy_choice = Prompt.ask(
+                        "Select strategy",
+                        choices=["1", "2"],
+                        default="1"
+                    )
+                except (EOFError, KeyboardInterrupt):
+                    console.print("\n[yellow]Operation cancelled[/yellow]")
+                    sys.exit(0)
+
+                if strategy_choice == "2":
+                    provider_strategy = "peertube_only"
+                    console.print("[yellow]→ Will only consider PeerTube for uploads (YouTube will be ignored)[/yellow]")
+                else:
+                    provider_strategy = "both"
+                    console.print("[green]→ Will consider both providers for uploads[/green]")
+
+            # Now determine which platforms to actually use based on strategy
+            if provider_strategy == "peertube_only":
+                # Force PeerTube only, even if YouTube is configured
+                selected_platform = "peertube"
+            else:
+                # Original logic for platform selection
+                console.print("\n[bold]Select upload platform(s):[/bold]")
+                platform_choices = []
+                choice_map = {}
+                choice_num = 1
+
+                if youtube_configured and peertube_configured:
+                    console.print(f"  {choice_num}. Both YouTube and PeerTube")
+                    choice_map[str(choice_num)] = "both"
+                    platform_choices.append(str(choice_num))
+                    choice_num += 1
+
+                if youtube_configured:
+                    console.print(f"  {choice_num}. YouTube only")
+                    choice_map[str(choice_num)] = "youtube"
+                    platform_choices.append(str(choice_num))
+                    choice_num += 1
+
+                if peertube_configured:
+                    console.print(f"  {choice_num}. PeerTube only")
+                    choice_map[str(choice_num)] = "peertube"
+                    platform_choices.append(str(choice_num))
+                    choice_num += 1
+
+                console.print("")
+                try:
+                    platform_choice = Prompt.ask(
+                        "Select platform",
+                        choices=platform_choices,
+                        default="1"
+                    )
+                except (EOFError, KeyboardInterrupt):
+                    console.print("\n[yellow]Operation cancelled[/yellow]")
+                    sys.exit(0)
+
+                selected_platform = choice_map[platform_choice]
+
+        from src.upload_orchestrator import UploadOrchestrator
+
+        if dry_run:
+            # Planning only reads metadata.json and the video files: no uploader, no authentication
+            display_upload_plan(
+                orchestrator=UploadOrchestrator(),
+                video_folder=selected_path,
+                metadata_list=metadata_list,
+                metadata_manager=metadata_manager,
+                upload_to_youtube=selected_platform in ("both", "youtube"),
+                upload_to_peertube=selected_platform in ("both", "peertube"),
+                peertube_only_mode=(provider_strategy == "peertube_only")
+            )
+            console.print("\n[yellow]Dry run: nothing was uploaded (--dry-run)[/yellow]")
+            return
 
-            selected_platform = choice_map[platform_choice]
+        from src.course_yml_updater import CourseYmlUpdater
 
-        # Initialize uploaders based on selection
+        # Initialize uploaders based on selection, importing only the platforms in use
         youtube_uploader = None
         peertube_uploader = None
-        peertube_upload_endpoint = os.getenv('PEERTUBE_UPLOAD_ENDPOINT')
-        peertube_verify_ssl = os.getenv('PEERTUBE_VERIFY_SSL', 'true').lower() == 'true'
 
         if selected_platform in ["both", "youtube"]:
-            youtube_uploader = YouTubeUploader(youtube_client_secrets)
+            from src.youtube_uploader import YouTubeUploader
+            youtube_uploader = YouTubeUploader(config.youtube_client_secrets_file)
             console.print("[green]✓ YouTube uploader initialized[/green]")
 
         if selected_platform in ["both", "peertube"]:
+            from src.peertube_uploader import PeerTubeUploader
             peertube_uploader = PeerTubeUploader(
-                instance_url=peertube_instance,
-                username=peertube_username,
-                password=peertube_password,
-                upload_endpoint=peertube_upload_endpoint,
-                verify_ssl=peertube_verify_ssl
+                instance_url=config.peertube_instance,
+                username=config.peertube_username,
+                password=config.peertube_password,
+                upload_endpoint=config.peertube_upload_endpoint,
+                verify_ssl=config.peertube_verify_ssl,
+                max_connections=peertube_concurrency
             )
             console.print("[green]✓ PeerTube uploader initialized[/green]")
 
@@ -351,13 +711,18 @@ def main(bec_repo: str, input_dir: str):
 
         # Upload videos with new simplified logic
         console.print(f"\n[bold]Processing videos for upload...[/bold]")
-        results = orchestrator.upload_batch(
+        results = upload_concurrently(
+            orchestrator=orchestrator,
             video_folder=selected_path,
             metadata_list=metadata_list,
             metadata_manager=metadata_manager,
             upload_to_youtube=youtube_uploader is not None,
             upload_to_peertube=peertube_uploader is not None,
-            peertube_only_mode=(provider_strategy == "peertube_only")
+            peertube_only_mode=(provider_strategy == "peertube_only"),
+            youtube_workers=upload_concurrency,
+            peertube_workers=peertube_concurrency,
+            youtube_limiter=TokenBucket(rate=youtube_uploads_per_minute / 60, burst=upload_concurrency),
+            peertube_limiter=AdaptiveConcurrencyLimiter(max_concurrency=peertube_concurrency)
         )
 
         # Display results
@@ -365,16 +730,19 @@ def main(bec_repo: str, input_dir: str):
         display_upload_results(results)
 
         # Summary
-        youtube_success = sum(1 for r in results if r.youtube_success)
-        peertube_success = sum(1 for r in results if r.peertube_success)
+        youtube_success = peertube_success = 0
+        for r in results:
+            youtube_success += r.youtube_success
+            peertube_success += r.peertube_success
 
         console.print(f"\n[bold]Upload Summary:[/bold]")
         if youtube_uploader:
             console.print(f"  YouTube: {youtube_success}/{len(results)} successful")
         if peertube_uploader:
             console.print(f"  PeerTube: {peertube_success}/{len(results)} successful")
+            peertube_uploader.close()
 
-        # Note: metadata.json is now updated inside upload_batch after each successful upload
+        # Note: uploads are journaled as they complete and compacted into metadata.json
         console.print(f"[green]✅ Process complete. Metadata is automatically saved.[/green]")
 
     else:
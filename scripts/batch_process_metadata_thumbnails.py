@@ -8,6 +8,7 @@ import sys
 import os
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,6 +17,12 @@ import requests
 from dotenv import load_dotenv
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from rich.console import Console
+from rich.markup import escape
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from src.peertube_uploader import PeerTubeUploader
 from scripts.update_peertube_thumbnails import PeerTubeThumbnailUpdater
 
@@ -27,79 +34,112 @@ console = Console()
 METADATA_FILE = Path(__file__).parent.parent / "metadata.json"
 
 
-def load_peertube_videos(metadata_file: Path = METADATA_FILE):
+# Number of completed thumbnails between two checkpoints of metadata.json
+CHECKPOINT_EVERY = 50
+
+# Progress line shown after each finished video
+PROGRESS_TEMPLATE = "[cyan]Processed: {title} (✅ {processed} | ❌ {failed})"
+
+# Videos processed concurrently (each one is network and ffmpeg bound)
+THUMB_WORKERS = max(1, int(os.getenv('THUMB_WORKERS', '4')))
+
+
+def load_metadata(metadata_file: Path = METADATA_FILE):
     """
-    Load all videos with PeerTube IDs from metadata.json.
-    Skips videos that already have thumbnail=true.
+    Load all records from metadata.json.
 
     Returns:
-        List of tuples (peertube_id, title)
+        List of metadata records, or None if the file is missing or invalid
     """
     if not metadata_file.exists():
         console.print(f"[red]❌ Error: {metadata_file} not found[/red]")
-        return []
+        return None
 
     try:
+        if orjson is not None:
+            return orjson.loads(metadata_file.read_bytes())
         with open(metadata_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        videos = []
-        skipped = 0
-        for item in data:
-            peertube_id = item.get('peertube_id')
-            # Skip if no peertube_id or if thumbnail already processed
-            if peertube_id:
-                if item.get('thumbnail', False):
-                    skipped += 1
-                    continue
-                title = item.get('title', 'Unknown')
-                videos.append((peertube_id, title))
-
-        if skipped > 0:
-            console.print(f"[yellow]ℹ️  Skipped {skipped} videos with existing thumbnails[/yellow]")
-
-        return videos
-
+            return json.load(f)
     except Exception as e:
         console.print(f"[red]❌ Error loading metadata.json: {e}[/red]")
-        return []
+        return None
+
+
+def load_peertube_videos(data):
+    """
+    List all videos with PeerTube IDs from the metadata.json records.
+    Skips videos that already have thumbnail=true.
 
+    Args:
+        data: Records loaded by load_metadata()
 
-def update_thumbnail_status(peertube_id: str, metadata_file: Path = METADATA_FILE) -> bool:
+    Returns:
+        List of tuples (peertube_id, title, display_title), display_title being
+        the title truncated to 50 characters and escaped for Rich markup
     """
-    Update metadata.json to mark thumbnail as completed for the given video.
+    videos = []
+    skipped = 0
+    for item in data:
+        peertube_id = item.get('peertube_id')
+        # Skip if no peertube_id or if thumbnail already processed
+        if peertube_id:
+            if item.get('thumbnail', False):
+                skipped += 1
+                continue
+            title = item.get('title', 'Unknown')
+            display_title = escape(title[:50] + "..." if len(title) > 50 else title)
+            videos.append((peertube_id, title, display_title))
+
+    if skipped > 0:
+        console.print(f"[yellow]ℹ️  Skipped {skipped} videos with existing thumbnails[/yellow]")
+
+    return videos
+
+
+def update_thumbnail_status(peertube_id: str, records_by_id: dict) -> bool:
+    """
+    Mark thumbnail as completed for the given video, in memory.
+    Changes are written by save_metadata().
 
     Args:
         peertube_id: PeerTube video UUID
-        metadata_file: Path to metadata.json
+        records_by_id: metadata.json records keyed by peertube_id
 
     Returns:
-        True if update successful, False otherwise
+        True if the video was found, False otherwise
     """
-    try:
-        # Read current data
-        with open(metadata_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    item = records_by_id.get(peertube_id)
+    if item is None:
+        return False
 
-        # Find and update the video entry
-        updated = False
-        for item in data:
-            if item.get('peertube_id') == peertube_id:
-                item['thumbnail'] = True
-                updated = True
-                break
+    item['thumbnail'] = True
+    return True
 
-        if not updated:
-            return False
 
-        # Write back to file
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+def save_metadata(data, metadata_file: Path = METADATA_FILE) -> bool:
+    """
+    Atomically write the records back to metadata.json.
+
+    Args:
+        data: Records to write
+        metadata_file: Path to metadata.json
 
+    Returns:
+        True if the write succeeded, False otherwise
+    """
+    tmp_file = metadata_file.with_name(metadata_file.name + '.tmp')
+    try:
+        if orjson is not None:
+            # Same 2-space indented UTF-8 as json.dump below
+            tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, metadata_file)
         return True
 
     except Exception as e:
-        console.print(f"[red]⚠️  Failed to update metadata for {peertube_id}: {e}[/red]")
+        console.print(f"[red]⚠️  Failed to save {metadata_file.name}: {e}[/red]")
         return False
 
 
@@ -120,36 +160,33 @@ def process_single_video(updater, video_uuid: str, video_title: str) -> bool:
     if not video_url:
         return False
 
-    # Step 2: Download video segment (first 10 seconds)
-    video_segment = updater.download_video_segment(video_url, duration=10)
-    if not video_segment:
+    # Step 2: Extract a frame at 4 seconds (PyAV, then single-pass ffmpeg, then segment fallback)
+    thumbnail = updater.extract_thumbnail(video_url, timestamp=4)
+    if not thumbnail:
         return False
 
-    # Step 3: Extract thumbnail at 4 seconds
-    thumbnail_path = updater.thumbnail_generator.extract_frame(
-        video_path=video_segment,
-        timestamp=4
-    )
+    # Step 3: Upload thumbnail to PeerTube
+    return updater.uploader.upload_thumbnail(video_uuid, thumbnail)
 
-    # Cleanup video segment
-    try:
-        video_segment.unlink()
-    except:
-        pass
 
-    if not thumbnail_path:
-        return False
+def process_video_task(updater, video_uuid: str, video_title: str):
+    """
+    Run process_single_video in a worker thread, capturing failures.
 
-    # Step 4: Upload thumbnail to PeerTube
-    success = updater.uploader.upload_thumbnail(video_uuid, thumbnail_path)
+    Args:
+        updater: PeerTubeThumbnailUpdater instance (shared, frames are kept in memory per call)
+        video_uuid: Video UUID or shortUUID
+        video_title: Video title for display
 
-    # Cleanup thumbnail
+    Returns:
+        Tuple (success, error message or None)
+    """
     try:
-        thumbnail_path.unlink()
-    except:
-        pass
-
-    return success
+        if process_single_video(updater, video_uuid, video_title):
+            return True, None
+        return False, 'Processing failed'
+    except Exception as e:
+        return False, str(e)
 
 
 def main():
@@ -167,11 +204,13 @@ def main():
     console.print("="*60)
     console.print(f"Instance: {instance_url}")
     console.print(f"Source: {METADATA_FILE}")
+    console.print(f"Workers: {THUMB_WORKERS}")
     console.print("="*60 + "\n")
 
     # Load videos from metadata.json
     console.print(f"📥 Loading videos from {METADATA_FILE.name}...")
-    videos = load_peertube_videos()
+    data = load_metadata()
+    videos = load_peertube_videos(data) if data else []
 
     if not videos:
         console.print(f"[red]❌ No videos with PeerTube IDs found in {METADATA_FILE.name}[/red]")
@@ -179,28 +218,40 @@ def main():
 
     console.print(f"[green]✅ Found {len(videos)} videos with PeerTube IDs[/green]\n")
 
-    # Create uploader and authenticate
+    # First record wins, like the former linear scan did
+    records_by_id = {}
+    for item in data:
+        peertube_id = item.get('peertube_id')
+        if peertube_id and peertube_id not in records_by_id:
+            records_by_id[peertube_id] = item
+
+    # Create updater
+    updater = PeerTubeThumbnailUpdater(
+        instance_url=instance_url,
+        username=username,
+        password=password,
+        verify_ssl=verify_ssl,
+        max_connections=THUMB_WORKERS
+    )
+
+    # Create uploader and authenticate, on the updater's pooled session so
+    # API lookups and thumbnail uploads share connections and the token
     console.print("🔐 Authenticating with PeerTube...")
     uploader = PeerTubeUploader(
         instance_url=instance_url,
         username=username,
         password=password,
-        verify_ssl=verify_ssl
+        verify_ssl=verify_ssl,
+        session=updater.session
     )
 
     if not uploader.authenticate():
         console.print("[red]❌ Authentication failed![/red]")
+        updater.close()
         return 1
 
     console.print("[green]✅ Authenticated successfully[/green]\n")
 
-    # Create updater
-    updater = PeerTubeThumbnailUpdater(
-        instance_url=instance_url,
-        username=username,
-        password=password,
-        verify_ssl=verify_ssl
-    )
     updater.uploader = uploader
 
     # Suppress logging during progress to keep output clean
@@ -216,6 +267,8 @@ def main():
         'errors': []
     }
 
+    pending_updates = 0
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -224,49 +277,57 @@ def main():
         TextColumn("({task.completed}/{task.total})"),
         TimeRemainingColumn(),
         console=console,
-        transient=False
+        transient=False,
+        refresh_per_second=4  # Cap redraws regardless of how fast videos finish
     ) as progress:
         task = progress.add_task(
             f"[cyan]Processing thumbnails (✅ {stats['processed']} | ❌ {stats['failed']})",
             total=len(videos)
         )
 
-        for video_uuid, video_title in videos:
-            # Truncate title for display
-            display_title = video_title[:50] + "..." if len(video_title) > 50 else video_title
-
-            # Update progress description
-            progress.update(
-                task,
-                description=f"[cyan]Processing: {display_title} (✅ {stats['processed']} | ❌ {stats['failed']})"
-            )
-
-            # Process video
-            try:
-                success = process_single_video(updater, video_uuid, video_title)
-
-                if success:
-                    stats['processed'] += 1
-                    # Update metadata.json to mark thumbnail as completed
-                    update_thumbnail_status(video_uuid)
-                else:
-                    stats['failed'] += 1
-                    stats['errors'].append({
-                        'uuid': video_uuid,
-                        'title': video_title[:50],
-                        'error': 'Processing failed'
-                    })
-
-            except Exception as e:
-                stats['failed'] += 1
-                stats['errors'].append({
-                    'uuid': video_uuid,
-                    'title': video_title[:50],
-                    'error': str(e)
-                })
-
-            # Advance progress
-            progress.advance(task)
+        try:
+            with ThreadPoolExecutor(max_workers=THUMB_WORKERS) as executor:
+                futures = {
+                    executor.submit(process_video_task, updater, video[0], video[1]): video
+                    for video in videos
+                }
+
+                for future in as_completed(futures):
+                    video_uuid, video_title, display_title = futures[future]
+                    success, error = future.result()
+
+                    if success:
+                        stats['processed'] += 1
+                        # Mark thumbnail as completed, checkpointing metadata.json periodically
+                        if update_thumbnail_status(video_uuid, records_by_id):
+                            pending_updates += 1
+                            if pending_updates >= CHECKPOINT_EVERY and save_metadata(data):
+                                pending_updates = 0
+
+                    if not success:
+                        stats['failed'] += 1
+                        stats['errors'].append({
+                            'uuid': video_uuid,
+                            'title': video_title[:50],
+                            'error': error
+                        })
+                        # Printed above the live progress bar without redrawing it
+                        progress.console.log(f"[red]❌ {display_title}: {error}[/red]")
+
+                    # Advance progress and show the last finished video in one update
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=PROGRESS_TEMPLATE.format(
+                            title=display_title,
+                            processed=stats['processed'],
+                            failed=stats['failed']
+                        )
+                    )
+        finally:
+            # Write remaining thumbnail updates, even if interrupted
+            if pending_updates:
+                save_metadata(data)
 
         # Update final description
         progress.update(
@@ -274,6 +335,8 @@ def main():
             description=f"[green]✅ Complete! (Processed: {stats['processed']} | Failed: {stats['failed']})"
         )
 
+    updater.close()
+
     # Print summary
     console.print("\n" + "="*60)
     console.print("[bold]📊 Summary[/bold]")
@@ -5,6 +5,7 @@ Batch update all course.yml files with PeerTube IDs from metadata.json
 
 import json
 import sys
+from dataclasses import fields
 from pathlib import Path
 
 # Add parent directory to path to import project modules
@@ -34,40 +35,30 @@ def load_metadata_entries():
     return data if isinstance(data, list) else data.get('videos', [])
 
 
+# VideoMetadata fields, read straight from the matching metadata.json keys
+FIELD_NAMES = tuple(field.name for field in fields(VideoMetadata))
+
+# Descriptive fields that may be missing from older entries
+TEXT_DEFAULTS = {'title': '', 'description': '', 'chapter_title': '', 'course_title': ''}
+
+
+def make_metadata(entry):
+    """Build a VideoMetadata from a metadata.json entry, ignoring unknown keys"""
+    values = {name: entry[name] for name in FIELD_NAMES if name in entry}
+    return VideoMetadata(**{**TEXT_DEFAULTS, **values})
+
+
 def convert_to_metadata_objects(entries):
     """Convert JSON entries to VideoMetadata objects"""
-    metadata_list = []
+    # Skip entries without peertube_id
+    entries = [entry for entry in entries if entry.get('peertube_id')]
 
+    # Skip entries without video_id (can't update course.yml)
     for entry in entries:
-        # Skip entries without peertube_id
-        if not entry.get('peertube_id'):
-            continue
-
-        # Skip entries without video_id (can't update course.yml)
         if not entry.get('video_id'):
             print(f"⚠️  Warning: Entry {entry.get('filename')} has peertube_id but no video_id, skipping")
-            continue
-
-        # Create VideoMetadata object with correct field names
-        metadata = VideoMetadata(
-            filename=entry['filename'],
-            course_index=entry['course_index'],
-            part_index=entry['part_index'],
-            chapter_index=entry['chapter_index'],
-            code_language=entry['code_language'],
-            title=entry.get('title', ''),
-            description=entry.get('description', ''),
-            chapter_title=entry.get('chapter_title', ''),
-            course_title=entry.get('course_title', ''),
-            video_id=entry.get('video_id'),
-            youtube_id=entry.get('youtube_id'),
-            peertube_id=entry.get('peertube_id'),
-            sha256_hash=entry.get('sha256_hash')
-        )
-
-        metadata_list.append(metadata)
-
-    return metadata_list
+
+    return [make_metadata(entry) for entry in entries if entry.get('video_id')]
 
 
 def group_by_course(metadata_list):
@@ -124,25 +115,30 @@ def main():
     total_failed = 0
 
     for course_index, course_metadata in sorted(courses.items()):
-        print(f"\n{'='*60}")
-        print(f"📖 Course: {course_index}")
-        print(f"{'='*60}")
-        print(f"Videos to update: {len(course_metadata)}\n")
-
+        # Build the course header and video list, then write it in one call
+        lines = [
+            f"\n{'='*60}",
+            f"📖 Course: {course_index}",
+            f"{'='*60}",
+            f"Videos to update: {len(course_metadata)}\n"
+        ]
         for metadata in course_metadata:
-            print(f"Processing: {metadata.filename}")
-            print(f"  Language: {metadata.code_language}")
-            print(f"  Video ID: {metadata.video_id}")
-            print(f"  PeerTube ID: {metadata.peertube_id}")
-
-            success = updater.update_video_ids(metadata)
-
-            if success:
-                total_success += 1
-            else:
-                total_failed += 1
-
-            print()  # Blank line for readability
+            lines.append(
+                f"Processing: {metadata.filename}\n"
+                f"  Language: {metadata.code_language}\n"
+                f"  Video ID: {metadata.video_id}\n"
+                f"  PeerTube ID: {metadata.peertube_id}"
+            )
+        lines.append("")  # Blank line for readability
+        print("\n".join(lines), flush=True)
+
+        # course.yml is loaded and written once per course
+        results = updater.update_video_ids_bulk(course_index, course_metadata)
+        course_success = sum(results.values())
+        total_success += course_success
+        total_failed += len(results) - course_success
+
+        print()  # Blank line for readability
 
     # Final summary
     print(f"\n{'='*60}")
@@ -9,14 +9,28 @@ This module provides utilities to:
 4. Upload thumbnails back to PeerTube
 """
 
+import io
 import sys
 import os
+import json
 import requests
 import tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import av  # PyAV: decode frames in-process instead of spawning ffmpeg
+except ImportError:
+    av = None
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.thumbnail_generator import ThumbnailGenerator
@@ -26,6 +40,42 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Without progress lines and banner, ffmpeg's stderr only carries actual errors
+FFMPEG_QUIET = ['-hide_banner', '-loglevel', 'error', '-nostats']
+
+
+# Segments and thumbnails are short-lived scratch files: keep them in RAM
+# (tmpfs) when available instead of writing them to disk
+SCRATCH_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+
+def http_input_options(video_url: str) -> List[str]:
+    """
+    ffmpeg input options for reading a remote video.
+
+    Range requests let ffmpeg fetch only the bytes it needs, and keeping the
+    connection alive avoids a new handshake per range or HLS fragment.
+
+    Args:
+        video_url: URL of the video file or HLS playlist
+
+    Returns:
+        Options to place before '-i'
+    """
+    options = [
+        '-reconnect', '1',              # Enable reconnection
+        '-reconnect_at_eof', '1',       # Reconnect at EOF
+        '-reconnect_streamed', '1',     # Reconnect for streamed protocols
+        '-reconnect_delay_max', '5',    # Max reconnect delay
+        '-timeout', '10000000',         # 10 second timeout (microseconds)
+        '-seekable', '1',               # Server supports HTTP Range requests
+        '-multiple_requests', '1',      # Reuse the connection between requests
+    ]
+    if video_url.split('?', 1)[0].endswith('.m3u8'):
+        options += ['-http_persistent', '1']  # Keep-alive across HLS fragments
+    return options
+
+
 class PeerTubeThumbnailUpdater:
     """
     Handles thumbnail generation for PeerTube videos by downloading video segments
@@ -33,7 +83,8 @@ class PeerTubeThumbnailUpdater:
     """
 
     def __init__(self, instance_url: str, username: str, password: str,
-                 verify_ssl: bool = True):
+                 verify_ssl: bool = True, max_connections: int = 20,
+                 use_pyav: bool = True):
         """
         Initialize PeerTube thumbnail updater.
 
@@ -42,11 +93,26 @@ class PeerTubeThumbnailUpdater:
             username: PeerTube account username
             password: PeerTube account password
             verify_ssl: Whether to verify SSL certificates
+            max_connections: Size of the API connection pool (at least the number of worker threads)
+            use_pyav: Extract frames in-process with PyAV when it is installed
         """
         self.instance_url = instance_url.rstrip('/')
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
+        self.use_pyav = use_pyav and av is not None
+
+        # API calls for many videos reuse pooled keep-alive connections
+        # instead of doing a TCP + TLS handshake per video
+        self.session = requests.Session()
+        self.session.verify = verify_ssl
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max_connections,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         # Initialize components
         self.thumbnail_generator = ThumbnailGenerator()
@@ -64,7 +130,8 @@ class PeerTubeThumbnailUpdater:
                 instance_url=self.instance_url,
                 username=self.username,
                 password=self.password,
-                verify_ssl=self.verify_ssl
+                verify_ssl=self.verify_ssl,
+                session=self.session  # API lookups and thumbnail uploads share connections
             )
 
         if not hasattr(self.uploader, 'access_token') or not self.uploader.access_token:
@@ -86,17 +153,14 @@ class PeerTubeThumbnailUpdater:
             # Get video details from API
             api_url = f"{self.instance_url}/api/v1/videos/{video_uuid}"
 
-            response = requests.get(
-                api_url,
-                verify=self.verify_ssl,
-                timeout=30
-            )
+            response = self.session.get(api_url, timeout=30)
 
             if response.status_code != 200:
                 logger.error(f"Failed to get video details: {response.status_code}")
                 return None
 
-            video_data = response.json()
+            # Video details list every file and playlist: decode with orjson when available
+            video_data = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
 
             # Try to get video URL from files array (WebTorrent)
             files = video_data.get('files', [])
@@ -144,7 +208,10 @@ class PeerTubeThumbnailUpdater:
             logger.error(f"Error getting video file URL: {e}")
             return None
 
-    def download_video_segment(self, video_url: str, duration: int = 10) -> Optional[Path]:
+    def download_video_segment(self, video_url: str, duration: int = 10,
+                               web_optimized: bool = False,
+                               resume_on_failure: bool = True,
+                               timestamp: Optional[float] = None) -> Optional[Path]:
         """
         Download the first N seconds of a video from URL.
 
@@ -153,47 +220,55 @@ class PeerTubeThumbnailUpdater:
         Args:
             video_url: Direct URL to video file
             duration: Number of seconds to download (default: 10)
+            web_optimized: Move the moov atom to the front (extra rewrite pass), only
+                           needed if the segment is served for progressive playback
+            resume_on_failure: If ffmpeg fails after writing a readable segment that
+                               already covers the requested duration, keep it instead
+                               of discarding it and downloading again
+            timestamp: Time of the frame the segment is downloaded for; a partial
+                       segment is then kept as soon as it extends past that frame
 
         Returns:
             Path to downloaded video segment or None if failed
         """
         import subprocess
 
-        try:
-            # Create temp file for video segment
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.mp4', prefix='video_segment_')
-            os.close(temp_fd)
-            segment_path = Path(temp_path)
+        # Create temp file for video segment
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.mp4', prefix='video_segment_', dir=SCRATCH_DIR)
+        os.close(temp_fd)
+        segment_path = Path(temp_path)
+        keep = False
 
+        try:
             logger.info(f"Downloading first {duration} seconds from {video_url[:50]}...")
 
             # Use ffmpeg to download only the first N seconds
             cmd = [
                 'ffmpeg',
+                *FFMPEG_QUIET,                  # Only report real errors
                 '-y',                           # Overwrite output
-                '-reconnect', '1',              # Enable reconnection
-                '-reconnect_at_eof', '1',       # Reconnect at EOF
-                '-reconnect_streamed', '1',     # Reconnect for streamed protocols
-                '-reconnect_delay_max', '5',    # Max reconnect delay
-                '-timeout', '10000000',         # 10 second timeout (microseconds)
+                *http_input_options(video_url), # Reconnect, range requests, keep-alive
                 '-i', video_url,                # Input URL
                 '-t', str(duration),            # Duration to download
                 '-c', 'copy',                   # Copy streams (no re-encoding)
-                '-movflags', 'faststart',       # Enable progressive download
-                str(segment_path)               # Output file
             ]
+            if web_optimized:
+                cmd += ['-movflags', 'faststart']  # Enable progressive download
+            cmd.append(str(segment_path))       # Output file
 
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=120  # 2 minute timeout
             )
 
             if result.returncode != 0:
-                logger.error(f"ffmpeg failed: {result.stderr}")
-                if segment_path.exists():
-                    segment_path.unlink()
+                logger.error(f"ffmpeg failed: {result.stderr.decode('utf-8', errors='replace')}")
+                if resume_on_failure and self._segment_covers(segment_path, duration, timestamp):
+                    logger.info("Partial segment already covers the needed duration, keeping it")
+                    keep = True
+                    return segment_path
                 return None
 
             if not segment_path.exists():
@@ -203,26 +278,241 @@ class PeerTubeThumbnailUpdater:
             file_size = segment_path.stat().st_size
             if file_size < 1000:  # Less than 1KB is suspicious
                 logger.error(f"Downloaded segment too small: {file_size} bytes")
-                segment_path.unlink()
                 return None
 
             logger.info(f"Downloaded {file_size / 1024 / 1024:.2f}MB video segment to {segment_path}")
+            keep = True
             return segment_path
 
         except subprocess.TimeoutExpired:
             logger.error(f"Timeout downloading video segment")
-            if segment_path.exists():
-                segment_path.unlink()
             return None
         except Exception as e:
             logger.error(f"Error downloading video segment: {e}")
-            if 'segment_path' in locals() and segment_path.exists():
-                segment_path.unlink()
             return None
+        finally:
+            # Single cleanup point: the segment only outlives this call when returned
+            if not keep:
+                segment_path.unlink(missing_ok=True)
+
+    def _segment_covers(self, segment_path: Path, duration: int,
+                        timestamp: Optional[float] = None) -> bool:
+        """
+        Check whether a possibly incomplete segment is readable and long enough.
+
+        ffmpeg still finalizes the output when the input connection drops, so a
+        failed run can leave a valid file holding most of the requested seconds.
+
+        Args:
+            segment_path: Downloaded video segment
+            duration: Number of seconds that were requested
+            timestamp: Time of the frame that must be in the segment, if any
+
+        Returns:
+            True if the segment can be used as is
+        """
+        if not segment_path.exists() or segment_path.stat().st_size < 1000:
+            return False
+        segment_duration = self.thumbnail_generator._get_video_duration(str(segment_path))
+        if segment_duration is None:
+            return False
+        # A segment ending exactly at the frame's time may not contain the frame
+        if timestamp is not None:
+            return segment_duration > timestamp
+        return segment_duration >= duration
+
+    def download_and_extract_thumbnail(self, video_url: str,
+                                       timestamp: float = 4) -> Optional[Path]:
+        """
+        Extract a thumbnail straight from the video URL with a single ffmpeg.
+
+        ffmpeg seeks with range requests and decodes only up to the frame, so
+        no intermediate segment is written to disk.
+
+        Args:
+            video_url: Direct URL to video file
+            timestamp: Time in seconds to extract frame (default: 4)
+
+        Returns:
+            Path to the JPEG thumbnail or None if failed
+        """
+        import subprocess
+
+        generator = self.thumbnail_generator
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.jpg', prefix='thumb_', dir=SCRATCH_DIR)
+        os.close(temp_fd)
+        thumbnail_path = Path(temp_path)
+
+        width, height = generator.DEFAULT_WIDTH, generator.DEFAULT_HEIGHT
+        cmd = [
+            'ffmpeg',
+            *FFMPEG_QUIET,                  # Only report real errors
+            '-y',                           # Overwrite the empty temp file
+            *http_input_options(video_url), # Reconnect, range requests, keep-alive
+            '-ss', str(timestamp),          # Seek before input, decode from nearest keyframe
+            '-i', video_url,                # Input URL
+            '-vf', f'scale={width}:{height}:force_original_aspect_ratio=decrease,pad={width}:{height}:(ow-iw)/2:(oh-ih)/2',  # Scale and pad to maintain aspect ratio
+            '-vframes', '1',                # Extract 1 frame
+            '-q:v', '5',                    # JPEG quality (5 is good quality, smaller file)
+            '-f', 'image2',                 # Force image format
+            str(thumbnail_path)             # Output file
+        ]
+
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=120)
+            if result.returncode != 0:
+                stderr = result.stderr.decode('utf-8', errors='replace')
+                logger.warning(f"Direct thumbnail extraction failed: {stderr[-500:]}")
+            else:
+                file_size = thumbnail_path.stat().st_size
+                if 100 < file_size <= generator.MAX_FILE_SIZE:
+                    logger.info(f"Extracted thumbnail from URL at {timestamp}s (size: {file_size} bytes)")
+                    return thumbnail_path
+                logger.warning(f"Direct thumbnail has unexpected size: {file_size} bytes")
+        except subprocess.TimeoutExpired:
+            logger.warning("Timeout extracting thumbnail directly from URL")
+        except Exception as e:
+            logger.warning(f"Error extracting thumbnail directly from URL: {e}")
+
+        if thumbnail_path.exists():
+            thumbnail_path.unlink()
+        return None
+
+    def _extract_thumbnail_pyav(self, video_url: str, timestamp: float = 4) -> Optional[bytes]:
+        """
+        Extract a thumbnail with PyAV, decoding in-process without an ffmpeg subprocess.
+
+        Args:
+            video_url: Direct URL to video file
+            timestamp: Time in seconds to extract frame (default: 4)
+
+        Returns:
+            JPEG bytes or None if failed
+        """
+        from PIL import ImageOps
+
+        options = {
+            'reconnect': '1',
+            'reconnect_streamed': '1',
+            'reconnect_delay_max': '5',
+            'timeout': '10000000',
+            'seekable': '1',
+            'multiple_requests': '1',
+        }
+        if video_url.split('?', 1)[0].endswith('.m3u8'):
+            options['http_persistent'] = '1'
+
+        try:
+            with av.open(video_url, options=options) as container:
+                stream = container.streams.video[0]
+                start = float(stream.start_time * stream.time_base) if stream.start_time else 0.0
+                target = start + timestamp
+
+                # Seek to the keyframe before the target, then decode up to it
+                container.seek(int(target / stream.time_base), stream=stream)
+                image = None
+                for frame in container.decode(stream):
+                    if frame.time is not None and frame.time >= target:
+                        image = frame.to_image()
+                        break
+        except Exception as e:
+            logger.warning(f"PyAV thumbnail extraction failed: {e}")
+            return None
+
+        if image is None:
+            logger.warning(f"No frame found at {timestamp}s")
+            return None
+
+        generator = self.thumbnail_generator
+        # Scale and pad to maintain aspect ratio, like the ffmpeg path
+        image = ImageOps.pad(image, (generator.DEFAULT_WIDTH, generator.DEFAULT_HEIGHT), color='black')
+
+        try:
+            # Lower the JPEG quality until the image fits PeerTube's size limit
+            quality = 85
+            while True:
+                buffer = io.BytesIO()
+                image.save(buffer, 'JPEG', quality=quality)
+                file_size = buffer.tell()
+                if file_size <= generator.MAX_FILE_SIZE or quality <= 40:
+                    break
+                quality -= 15
+        except Exception as e:
+            logger.warning(f"Error encoding PyAV thumbnail: {e}")
+            return None
+
+        if file_size > generator.MAX_FILE_SIZE:
+            logger.warning(f"PyAV thumbnail too large: {file_size} bytes")
+            return None
+
+        logger.info(f"Extracted thumbnail with PyAV at {timestamp}s (size: {file_size} bytes)")
+        return buffer.getvalue()
+
+    def _extract_thumbnail_via_segment(self, video_url: str,
+                                       timestamp: float) -> Optional[Path]:
+        """
+        Two-stage fallback: download a segment to disk, then extract the frame.
+
+        Args:
+            video_url: Direct URL to video file
+            timestamp: Time in seconds to extract frame
+
+        Returns:
+            Path to the JPEG thumbnail or None if failed
+        """
+        # Only the seconds up to the thumbnail frame are needed
+        video_segment = self.download_video_segment(video_url, duration=int(timestamp) + 1,
+                                                    timestamp=timestamp)
+        if not video_segment:
+            return None
+
+        try:
+            return self.thumbnail_generator.extract_frame(
+                video_path=video_segment,
+                timestamp=timestamp
+            )
+        finally:
+            # Cleanup video segment
+            if video_segment.exists():
+                video_segment.unlink()
+
+    def extract_thumbnail(self, video_url: str, timestamp: float = 4) -> Optional[bytes]:
+        """
+        Extract a thumbnail with the cheapest method that works.
+
+        Tries PyAV (in-process), then a single ffmpeg reading the URL directly,
+        then the segment download fallback.
+
+        Args:
+            video_url: Direct URL to video file
+            timestamp: Time in seconds to extract frame (default: 4)
+
+        Returns:
+            JPEG bytes or None if failed
+        """
+        if self.use_pyav:
+            thumbnail = self._extract_thumbnail_pyav(video_url, timestamp=timestamp)
+            if thumbnail:
+                return thumbnail
+
+        thumbnail_path = self.download_and_extract_thumbnail(video_url, timestamp=timestamp)
+        if not thumbnail_path:
+            logger.info("Falling back to segment download")
+            thumbnail_path = self._extract_thumbnail_via_segment(video_url, timestamp)
+        if not thumbnail_path:
+            return None
+
+        try:
+            return thumbnail_path.read_bytes()
+        except OSError as e:
+            logger.warning(f"Error reading thumbnail: {e}")
+            return None
+        finally:
+            thumbnail_path.unlink(missing_ok=True)
 
     def process_video(self, video_uuid: str, timestamp: float = 4) -> bool:
         """
-        Complete workflow: Download video segment, extract thumbnail, upload to PeerTube.
+        Complete workflow: Extract thumbnail from the video URL, upload to PeerTube.
 
         Args:
             video_uuid: Video UUID or shortUUID
@@ -237,54 +527,45 @@ class PeerTubeThumbnailUpdater:
             return False
 
         # Step 1: Get video URL
-        logger.info(f"Step 1/4: Getting video file URL for {video_uuid}")
+        logger.info(f"Step 1/3: Getting video file URL for {video_uuid}")
         video_url = self.get_video_file_url(video_uuid)
         if not video_url:
             return False
 
-        # Step 2: Download video segment
-        logger.info(f"Step 2/4: Downloading video segment")
-        video_segment = self.download_video_segment(video_url, duration=10)
-        if not video_segment:
+        # Step 2: Extract thumbnail straight from the URL
+        logger.info(f"Step 2/3: Extracting thumbnail at {timestamp}s")
+        thumbnail = self.extract_thumbnail(video_url, timestamp=timestamp)
+        if not thumbnail:
+            logger.error("Failed to extract thumbnail")
             return False
 
-        try:
-            # Step 3: Extract thumbnail
-            logger.info(f"Step 3/4: Extracting thumbnail at {timestamp}s")
-            thumbnail_path = self.thumbnail_generator.extract_frame(
-                video_path=video_segment,
-                timestamp=timestamp
-            )
-
-            if not thumbnail_path:
-                logger.error("Failed to extract thumbnail")
-                return False
+        # Step 3: Upload thumbnail
+        logger.info(f"Step 3/3: Uploading thumbnail to PeerTube")
+        success = self.uploader.upload_thumbnail(video_uuid, thumbnail)
 
-            try:
-                # Step 4: Upload thumbnail
-                logger.info(f"Step 4/4: Uploading thumbnail to PeerTube")
-                success = self.uploader.upload_thumbnail(video_uuid, thumbnail_path)
+        if success:
+            logger.info(f"✅ Successfully updated thumbnail for {video_uuid}")
+        else:
+            logger.error(f"❌ Failed to upload thumbnail for {video_uuid}")
 
-                if success:
-                    logger.info(f"✅ Successfully updated thumbnail for {video_uuid}")
-                else:
-                    logger.error(f"❌ Failed to upload thumbnail for {video_uuid}")
+        return success
 
-                return success
+    def cleanup(self):
+        """Cleanup temporary files and close pooled connections."""
+        self.thumbnail_generator.cleanup_temp_files()
+        self.close()
 
-            finally:
-                # Cleanup thumbnail
-                if thumbnail_path.exists():
-                    thumbnail_path.unlink()
+    def close(self):
+        """Close the API session."""
+        self.session.close()
 
-        finally:
-            # Cleanup video segment
-            if video_segment.exists():
-                video_segment.unlink()
+    def __enter__(self):
+        """Context manager entry."""
+        return self
 
-    def cleanup(self):
-        """Cleanup temporary files."""
-        self.thumbnail_generator.cleanup_temp_files()
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - cleanup temp files and connections."""
+        self.cleanup()
 
 
 if __name__ == "__main__":
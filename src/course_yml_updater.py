@@ -1,3 +1,4 @@
+import os
 from ruamel.yaml import YAML
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -24,6 +25,8 @@ class CourseYmlUpdater:
         self.yaml.width = 4096  # Prevent line wrapping
         # BEC repo uses: list items at 2 spaces, content at 4 spaces, nested lists at 6 spaces
         self.yaml.indent(mapping=4, sequence=4, offset=2)
+        # Plain loader (C-accelerated when available) for read-only checks
+        self._fast_yaml = YAML(typ='safe')
 
         if not self.courses_dir.exists():
             raise ValueError(f"Courses directory not found at {self.courses_dir}")
@@ -38,21 +41,52 @@ class CourseYmlUpdater:
         Returns:
             True if update successful, False otherwise
         """
-        if not metadata.video_id:
-            print(f"⚠️  Warning: No video_id for {metadata.filename}, skipping course.yml update")
-            return False
+        return self.update_video_ids_bulk(metadata.course_index, [metadata])[metadata.filename]
 
-        if not metadata.youtube_id and not metadata.peertube_id:
-            print(f"⚠️  Warning: No video IDs to update for {metadata.filename}")
-            return False
+    def update_video_ids_bulk(self, course_index: str,
+                              metadata_list: List[VideoMetadata]) -> Dict[str, bool]:
+        """
+        Update one course.yml with the video IDs of several videos
+
+        The file is loaded and written once for the whole list instead of once per video.
+
+        Args:
+            course_index: Course whose course.yml is updated (e.g., 'btc101')
+            metadata_list: VideoMetadata of that course with video_id and platform IDs
+
+        Returns:
+            Dictionary mapping filenames to update success status
+        """
+        results = {}
+        to_apply = []
+        for metadata in metadata_list:
+            if not metadata.video_id:
+                print(f"⚠️  Warning: No video_id for {metadata.filename}, skipping course.yml update")
+                results[metadata.filename] = False
+            elif not metadata.youtube_id and not metadata.peertube_id:
+                print(f"⚠️  Warning: No video IDs to update for {metadata.filename}")
+                results[metadata.filename] = False
+            else:
+                to_apply.append(metadata)
+
+        if not to_apply:
+            return results
 
-        course_yml_path = self.courses_dir / metadata.course_index / "course.yml"
+        course_yml_path = self.courses_dir / course_index / "course.yml"
 
         if not course_yml_path.exists():
             print(f"❌ Error: course.yml not found at {course_yml_path}")
-            return False
+            results.update((metadata.filename, False) for metadata in to_apply)
+            return results
 
         try:
+            # Re-runs mostly carry IDs the file already has: check them with the
+            # fast loader before paying for a round-trip load and a rewrite
+            if self._has_video_ids(self._load_course_yaml_fast(course_yml_path), to_apply):
+                print(f"✓ Already up to date: {course_yml_path}")
+                results.update((metadata.filename, True) for metadata in to_apply)
+                return results
+
             # Load existing course.yml with ruamel.yaml (preserves formatting)
             with open(course_yml_path, 'r', encoding='utf-8') as f:
                 course_data = self.yaml.load(f)
@@ -60,58 +94,180 @@ class CourseYmlUpdater:
             if 'videos' not in course_data:
                 course_data['videos'] = []
 
-            # Find or create video entry for this video_id
-            video_entry = self._find_or_create_video_entry(
-                course_data['videos'],
-                metadata.video_id
-            )
+            # Index entries once so each video finds its entry in O(1)
+            entries_by_id = self._index_videos(course_data['videos'])
 
-            # Update YouTube ID if present
-            if metadata.youtube_id:
-                self._update_platform_id(
-                    video_entry,
-                    'youtube',
-                    metadata.code_language,
-                    metadata.youtube_id
-                )
-                print(f"✓ Updated YouTube ID for {metadata.code_language}: {metadata.youtube_id}")
-
-            # Update PeerTube ID if present
-            if metadata.peertube_id:
-                self._update_platform_id(
-                    video_entry,
-                    'peertube',
-                    metadata.code_language,
-                    metadata.peertube_id
-                )
-                print(f"✓ Updated PeerTube ID for {metadata.code_language}: {metadata.peertube_id}")
+            for metadata in to_apply:
+                self._apply_video_ids(course_data['videos'], metadata, entries_by_id)
 
             # Write back to course.yml (preserves original formatting)
-            with open(course_yml_path, 'w', encoding='utf-8') as f:
-                self.yaml.dump(course_data, f)
+            self._dump_course_yml(course_yml_path, course_data)
 
-            print(f"✅ Successfully updated {course_yml_path}")
-            return True
+            if len(to_apply) == 1:
+                print(f"✅ Successfully updated {course_yml_path}")
+            else:
+                print(f"✅ Successfully updated {course_yml_path} ({len(to_apply)} videos)")
+            results.update((metadata.filename, True) for metadata in to_apply)
 
         except Exception as e:
             print(f"❌ Error updating course.yml: {e}")
+            results.update((metadata.filename, False) for metadata in to_apply)
+
+        return results
+
+    def update_video_ids_batch(self, metadata_list: List[VideoMetadata]) -> Dict[str, bool]:
+        """
+        Update the course.yml files of many videos, loading and writing each file once
+
+        Args:
+            metadata_list: VideoMetadata objects, possibly spanning several courses
+
+        Returns:
+            Dictionary mapping filenames to update success status
+        """
+        by_course: Dict[str, List[VideoMetadata]] = {}
+        for metadata in metadata_list:
+            by_course.setdefault(metadata.course_index, []).append(metadata)
+
+        results = {}
+        for course_index, course_metadata in by_course.items():
+            results.update(self.update_video_ids_bulk(course_index, course_metadata))
+        return results
+
+    def _load_course_yaml_fast(self, course_yml_path: Path) -> Any:
+        """
+        Load course.yml as plain Python data, without formatting information
+
+        Only for reading: the result cannot be dumped back without losing the file layout.
+
+        Args:
+            course_yml_path: Path to the course.yml file
+
+        Returns:
+            Parsed course data
+        """
+        with open(course_yml_path, 'r', encoding='utf-8') as f:
+            return self._fast_yaml.load(f)
+
+    @staticmethod
+    def _has_video_ids(course_data: Any, metadata_list: List[VideoMetadata]) -> bool:
+        """
+        Check whether course data already holds the platform IDs of every video
+
+        Args:
+            course_data: Parsed course.yml data
+            metadata_list: VideoMetadata with video_id and platform IDs
+
+        Returns:
+            True if applying the videos would not change anything
+        """
+        if not isinstance(course_data, dict):
             return False
 
-    def _find_or_create_video_entry(self, videos: List[Dict[str, Any]], video_id: str) -> Dict[str, Any]:
+        entries_by_id = CourseYmlUpdater._index_videos(course_data.get('videos') or [])
+
+        for metadata in metadata_list:
+            video_entry = entries_by_id.get(metadata.video_id)
+            if video_entry is None:
+                return False
+            for platform, platform_id in (('youtube', metadata.youtube_id),
+                                          ('peertube', metadata.peertube_id)):
+                if not platform_id:
+                    continue
+                # Same entry _update_platform_id would write to
+                current = next((entry[metadata.code_language]
+                                for entry in video_entry.get(platform) or []
+                                if isinstance(entry, dict) and metadata.code_language in entry),
+                               None)
+                if current != platform_id:
+                    return False
+        return True
+
+    def _dump_course_yml(self, course_yml_path: Path, course_data):
+        """
+        Write course.yml through a temporary file so it is never left half-written
+
+        Args:
+            course_yml_path: Path to the course.yml file
+            course_data: Loaded course data to dump
+        """
+        tmp_path = course_yml_path.with_name(course_yml_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                self.yaml.dump(course_data, f)
+            os.replace(tmp_path, course_yml_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _index_videos(videos: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Index course.yml video entries by id (the first entry wins, as a scan would find it)
+
+        Args:
+            videos: List of video entries from course.yml
+
+        Returns:
+            Dictionary mapping video ids to their entries
+        """
+        entries_by_id = {}
+        for video in videos:
+            video_id = video.get('id')
+            if video_id:
+                entries_by_id.setdefault(video_id, video)
+        return entries_by_id
+
+    def _apply_video_ids(self, videos: List[Dict[str, Any]], metadata: VideoMetadata,
+                         entries_by_id: Dict[str, Dict[str, Any]]):
+        """
+        Set the platform IDs of one video in the loaded course.yml videos list
+
+        Args:
+            videos: List of video entries from course.yml
+            metadata: VideoMetadata with video_id and platform IDs
+            entries_by_id: Index of videos by id (see _index_videos), kept up to date
+        """
+        # Find or create video entry for this video_id
+        video_entry = self._find_or_create_video_entry(videos, metadata.video_id, entries_by_id)
+
+        # Update YouTube ID if present
+        if metadata.youtube_id:
+            self._update_platform_id(
+                video_entry,
+                'youtube',
+                metadata.code_language,
+                metadata.youtube_id
+            )
+            print(f"✓ Updated YouTube ID for {metadata.code_language}: {metadata.youtube_id}")
+
+        # Update PeerTube ID if present
+        if metadata.peertube_id:
+            self._update_platform_id(
+                video_entry,
+                'peertube',
+                metadata.code_language,
+                metadata.peertube_id
+            )
+            print(f"✓ Updated PeerTube ID for {metadata.code_language}: {metadata.peertube_id}")
+
+    def _find_or_create_video_entry(self, videos: List[Dict[str, Any]], video_id: str,
+                                    entries_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Find existing video entry by video_id or create new one
 
         Args:
             videos: List of video entries from course.yml
             video_id: UUID from :::video id=...::: tag
+            entries_by_id: Index of videos by id, updated with created entries
 
         Returns:
             Video entry dictionary
         """
         # Search for existing entry
-        for video in videos:
-            if video.get('id') == video_id:
-                return video
+        video = entries_by_id.get(video_id)
+        if video is not None:
+            return video
 
         # Create new entry if not found
         new_entry = {
@@ -120,6 +276,7 @@ class CourseYmlUpdater:
             'peertube': []
         }
         videos.append(new_entry)
+        entries_by_id[video_id] = new_entry
         return new_entry
 
     def _update_platform_id(self, video_entry: Dict[str, Any], platform: str,
@@ -152,15 +309,15 @@ class CourseYmlUpdater:
         """
         Batch update course.yml files for multiple videos
 
+        Each course.yml is loaded and written once, however many of its videos are updated.
+
         Args:
             metadata_list: List of VideoMetadata objects
 
         Returns:
             Dictionary mapping filenames to update success status
         """
-        results = {}
-        for metadata in metadata_list:
-            if metadata.youtube_id or metadata.peertube_id:
-                success = self.update_video_ids(metadata)
-                results[metadata.filename] = success
-        return results
+        return self.update_video_ids_batch([
+            metadata for metadata in metadata_list
+            if metadata.youtube_id or metadata.peertube_id
+        ])
@@ -1,11 +1,88 @@
+import json
 import os
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
 from rich.console import Console
 
+# {course_index}_{part_index}.{chapter_index}_{code_language}
+_FILENAME_RE = re.compile(r'^([^_]+)_(\d+)\.(\d+)_([^_]+)$')
+_FRONTMATTER_NAME_RE = re.compile(r'^name:\s*(.*)$')
+_VIDEO_ID_RE = re.compile(r':::video id=([^:]+):::')
+# Case-insensitive tag tests, without lowercasing a copy of the look-ahead lines
+_PART_ID_RE = re.compile(r'<partid', re.IGNORECASE)
+_CHAPTER_ID_RE = re.compile(r'<chapterid', re.IGNORECASE)
+
+# Standard footer appended to video descriptions during upload
+DESCRIPTION_FOOTER = """
+—
+Plan ₿ Network  — Scaling Bitcoin Adoption
+
+Level up your Bitcoin knowledge and Explore all our free, open‑source courses on the platform:
+https://planb.network
+
+Follow us on social:
+Twitter: @planb_network
+
+⚠️ Disclaimer & Risk Warning
+
+Cryptocurrencies are risky. All content is for educational and informational purposes only and does not constitute financial advice. Consult a licensed financial adviser before making any significant financial decisions. Bitcoin is highly volatile and speculative; investing can lead to losses. Never invest more than you can afford to lose. Past performance is not indicative of future results.
+
+The crypto industry contains scams—verify sources and do your own research. Do not trust anyone blindly, including us. We do not partner with any altcoin projects. Our content is free and open source under the CC BY-SA license. We are independent and have no obligations or contracts with any cryptocurrency or ICO.
+
+We will never ask for your private information (seed phrase, private keys, name, address, KYC). We are not responsible for losses due to scams, key mismanagement, or poor investments.
+
+More info:
+
+💻 https://planb.network/about
+
+📬 contact@planb.network
+
+—"""
+
+# Read size when hashing videos (one reusable buffer per hashing thread)
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _iter_with_lookahead(f, size: int) -> Iterator[Tuple[str, Deque[str]]]:
+    """
+    Yield each line of a text file with the following lines, without reading it whole
+
+    Args:
+        f: File object opened in text mode
+        size: Number of following lines to provide
+
+    Returns:
+        Iterator of (line, next lines); the deque is only valid until the next step
+    """
+    lines = (line.rstrip('\n') for line in f)
+    ahead = deque(islice(lines, size + 1))
+    while ahead:
+        line = ahead.popleft()
+        yield line, ahead
+        next_line = next(lines, None)
+        if next_line is not None:
+            ahead.append(next_line)
+
+
+@lru_cache(maxsize=64)
+def _course_display(course_index: str) -> str:
+    """Convert course index to display format (btc101 -> BTC 101)"""
+    course_display = course_index.upper()
+    if course_display.startswith('BTC') and len(course_display) > 3:
+        course_display = f"{course_display[:3]} {course_display[3:]}"
+    return course_display
+
+
+# (course_title, {(part_index, chapter_index): (chapter_title, video_id)})
+CourseIndex = Tuple[str, Dict[Tuple[int, int], Tuple[str, Optional[str]]]]
+
 
 @dataclass
 class VideoMetadata:
@@ -22,6 +99,8 @@ class VideoMetadata:
     youtube_id: Optional[str] = None
     peertube_id: Optional[str] = None
     sha256_hash: Optional[str] = None
+    file_size: Optional[int] = None  # st_size and st_mtime_ns the hash was computed for
+    file_mtime_ns: Optional[int] = None
 
 
 class MetadataExtractor:
@@ -32,6 +111,80 @@ class MetadataExtractor:
         if not self.courses_dir.exists():
             raise ValueError(f"Courses directory not found at {self.courses_dir}")
 
+        # SHA256 of previously hashed files: absolute path -> [st_mtime_ns, st_size, hash]
+        self.hash_cache: Dict[str, list] = {}
+        # Same hashes keyed by (filename, st_size, st_mtime_ns), so moved or copied
+        # folders (mv, cp -p, rsync -t keep mtimes) are recognised too
+        self._hash_by_stat: Dict[Tuple[str, int, int], str] = {}
+        # Trust (size, mtime) to reuse hashes; disable to re-read every video
+        self.fast_stat_mode = True
+        # Parsed course markdown and the st_mtime_ns it was parsed at, keyed by
+        # (course_index, code_language); every video of a course reads the same file
+        self._course_md_cache: Dict[Tuple[str, str], Tuple[int, CourseIndex]] = {}
+
+    def load_hash_cache(self, cache_file: Path):
+        """
+        Load SHA256 results persisted by a previous run
+
+        Args:
+            cache_file: Path to the JSON hash cache (missing or corrupt files start empty)
+        """
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                self.hash_cache = json.load(f)
+        except (OSError, ValueError):
+            self.hash_cache = {}
+
+        self._hash_by_stat = {
+            (os.path.basename(path), size, mtime_ns): sha256_hash
+            for path, (mtime_ns, size, sha256_hash) in self.hash_cache.items()
+        }
+
+    def save_hash_cache(self, cache_file: Path):
+        """
+        Persist SHA256 results so the next run can skip re-reading unchanged videos
+
+        Args:
+            cache_file: Path to the JSON hash cache
+        """
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.hash_cache, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not save hash cache: {e}")
+
+    def get_cached_hash(self, video_file: Path, stat_result: os.stat_result) -> Optional[str]:
+        """
+        Look up the SHA256 of a video if it is unchanged since it was last hashed
+
+        Without fast_stat_mode nothing is reused and every video is hashed.
+
+        Args:
+            video_file: Path to the video file
+            stat_result: Current stat of the video file
+
+        Returns:
+            Cached hash, or None if the file is unknown or was modified
+        """
+        if not self.fast_stat_mode:
+            return None
+
+        entry = self.hash_cache.get(str(video_file.absolute()))
+        if entry and entry[0] == stat_result.st_mtime_ns and entry[1] == stat_result.st_size:
+            return entry[2]
+
+        # Unknown path: same name, size and mtime as a file hashed elsewhere
+        return self._hash_by_stat.get((video_file.name, stat_result.st_size, stat_result.st_mtime_ns))
+
+    def remember_hash(self, video_file: Path, stat_result: os.stat_result, sha256_hash: str):
+        """Record the SHA256 of a video together with the stat it was computed for"""
+        self.hash_cache[str(video_file.absolute())] = [
+            stat_result.st_mtime_ns, stat_result.st_size, sha256_hash
+        ]
+        self._hash_by_stat[(video_file.name, stat_result.st_size, stat_result.st_mtime_ns)] = sha256_hash
+
     @staticmethod
     def calculate_file_hash(file_path: Path) -> str:
         """
@@ -47,10 +200,17 @@ class MetadataExtractor:
         
         sha256_hash = hashlib.sha256()
         
-        # Read file in chunks to handle large video files efficiently
-        with open(file_path, 'rb') as f:
-            for byte_block in iter(lambda: f.read(4096 * 1024), b""):  # 4MB chunks
-                sha256_hash.update(byte_block)
+        # Read file in 8MB chunks into one reusable buffer; unbuffered, so the
+        # kernel copies straight into it (hashlib.file_digest uses 256KB reads)
+        buffer = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buffer)
+        with open(file_path, 'rb', buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                # Only the bytes read by this call (the tail of the buffer may be stale)
+                sha256_hash.update(view[:size])
         
         return sha256_hash.hexdigest()
 
@@ -66,8 +226,7 @@ class MetadataExtractor:
             filename = filename[:-4]
 
         # Pattern: courseindex_partindex.chapterindex_codelanguage
-        pattern = r'^([^_]+)_(\d+)\.(\d+)_([^_]+)$'
-        match = re.match(pattern, filename)
+        match = _FILENAME_RE.match(filename)
 
         if not match:
             raise ValueError(f"Filename '{filename}' doesn't match expected pattern")
@@ -79,91 +238,74 @@ class MetadataExtractor:
 
         return course_index, part_index, chapter_index, code_language
 
-    def get_course_title(self, course_index: str, code_language: str) -> str:
+    def _parse_course_md(self, course_index: str, code_language: str) -> CourseIndex:
         """
-        Extract course title from the markdown file header
-        """
-        md_file = self.courses_dir / course_index / f"{code_language}.md"
-
-        if not md_file.exists():
-            raise FileNotFoundError(f"Course file not found: {md_file}")
-
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Extract name from YAML front matter
-        lines = content.split('\n')
-        in_frontmatter = False
-        for line in lines:
-            if line.strip() == '---':
-                if not in_frontmatter:
-                    in_frontmatter = True
-                    continue
-                else:
-                    break
+        Parse a course markdown file once into its title and chapter index.
 
-            if in_frontmatter and line.startswith('name:'):
-                return line.replace('name:', '').strip().strip('"').strip("'")
+        The parsed result is reused until the file's modification time changes.
 
-        return f"Course {course_index.upper()}"
-
-    def get_chapter_title(self, course_index: str, part_index: int,
-                         chapter_index: int, code_language: str) -> Tuple[str, Optional[str]]:
-        """
-        Extract chapter title and video ID based on part and chapter indices
+        Args:
+            course_index: Course identifier (e.g. 'btc101')
+            code_language: Language code of the markdown file
 
-        Returns: (chapter_title, video_id)
-        Note: video_id is extracted from :::video id=UUID::: tag, which maps to course.yml
+        Returns:
+            (course_title, {(part_index, chapter_index): (chapter_title, video_id)})
         """
+        key = (course_index, code_language)
         md_file = self.courses_dir / course_index / f"{code_language}.md"
 
-        if not md_file.exists():
-            raise FileNotFoundError(f"Course file not found: {md_file}")
+        try:
+            mtime_ns = md_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Course file not found: {md_file}") from None
 
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        cached = self._course_md_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
 
-        lines = content.split('\n')
+        course_title = None
+        chapters: Dict[Tuple[int, int], Tuple[str, Optional[str]]] = {}
         current_part = 0
         current_chapter = 0
         in_frontmatter = False
         frontmatter_ended = False  # Track if we've finished processing frontmatter
 
-        # Helper function to check if partId/chapterId exists within next few lines
-        def has_tag_nearby(lines_list, start_idx, tag_name, max_distance=5):
-            """Check if a tag exists within max_distance lines after start_idx"""
-            for j in range(start_idx + 1, min(start_idx + 1 + max_distance, len(lines_list))):
-                if tag_name.lower() in lines_list[j].lower():
-                    return True
-            return False
-
-        for i, line in enumerate(lines):
-            # Skip frontmatter (only at the beginning of the file)
-            if line.strip() == '---' and not frontmatter_ended:
-                in_frontmatter = not in_frontmatter
-                # If we're exiting frontmatter, mark it as ended
-                if not in_frontmatter:
-                    frontmatter_ended = True
-                continue
-            if in_frontmatter:
-                continue
+        with open(md_file, 'r', encoding='utf-8') as f:
+            # Stream the file, keeping only the few lines the tag look-ahead needs
+            for line, ahead in _iter_with_lookahead(f, 9):
+                # Skip frontmatter (only at the beginning of the file)
+                if not frontmatter_ended and line.strip() == '---':
+                    in_frontmatter = not in_frontmatter
+                    # If we're exiting frontmatter, mark it as ended
+                    if not in_frontmatter:
+                        frontmatter_ended = True
+                    continue
+                if in_frontmatter:
+                    # Course name from YAML front matter
+                    if course_title is None:
+                        name_match = _FRONTMATTER_NAME_RE.match(line)
+                        if name_match:
+                            course_title = name_match.group(1).strip().strip('"').strip("'")
+                    continue
+
+                if not line.startswith('#'):
+                    continue
+
+                # Check for part header (single #)
+                if line.startswith('# '):
+                    # Look for partId tag within next few lines
+                    if _PART_ID_RE.search('\n'.join(islice(ahead, 5))):
+                        current_part += 1
+                        current_chapter = 0
+
+                # Check for chapter header (double ##)
+                elif line.startswith('## '):
+                    # Look for chapterId tag within next few lines
+                    if _CHAPTER_ID_RE.search('\n'.join(islice(ahead, 5))):
+                        current_chapter += 1
+                        if (current_part, current_chapter) in chapters:
+                            continue
 
-            # Check for part header (single #)
-            if line.startswith('# ') and not line.startswith('## '):
-                # Look for partId tag within next few lines
-                if has_tag_nearby(lines, i, '<partId'):
-                    current_part += 1
-                    current_chapter = 0
-
-            # Check for chapter header (double ##)
-            elif line.startswith('## ') and not line.startswith('### '):
-                # Look for chapterId tag within next few lines
-                if has_tag_nearby(lines, i, '<chapterId'):
-                    current_chapter += 1
-
-                    # Check if this is the chapter we're looking for
-                    if current_part == part_index and current_chapter == chapter_index:
-                        # Found the target chapter - extract the title text
                         chapter_title = line[2:].strip()  # Remove '##' and whitespace
                         # Remove any markdown formatting
                         chapter_title = chapter_title.replace('**', '').replace('*', '')
@@ -171,33 +313,58 @@ class MetadataExtractor:
 
                         # Extract video ID from :::video id=UUID::: tag in next few lines
                         video_id = None
-                        for j in range(i + 1, min(i + 10, len(lines))):
-                            if ':::video id=' in lines[j]:
+                        for next_line in ahead:
+                            if ':::video id=' in next_line:
                                 # Extract UUID from :::video id=UUID:::
-                                video_match = re.search(r':::video id=([^:]+):::', lines[j])
+                                video_match = _VIDEO_ID_RE.search(next_line)
                                 if video_match:
                                     video_id = video_match.group(1)
                                 break
 
-                        return chapter_title, video_id
+                        chapters[(current_part, current_chapter)] = (chapter_title, video_id)
+
+        if course_title is None:
+            course_title = f"Course {course_index.upper()}"
+
+        parsed = (course_title, chapters)
+        self._course_md_cache[key] = (mtime_ns, parsed)
+        return parsed
+
+    def get_course_title(self, course_index: str, code_language: str) -> str:
+        """
+        Extract course title from the markdown file header
+        """
+        return self._parse_course_md(course_index, code_language)[0]
+
+    def get_chapter_title(self, course_index: str, part_index: int,
+                         chapter_index: int, code_language: str) -> Tuple[str, Optional[str]]:
+        """
+        Extract chapter title and video ID based on part and chapter indices
 
+        Returns: (chapter_title, video_id)
+        Note: video_id is extracted from :::video id=UUID::: tag, which maps to course.yml
+        """
+        chapters = self._parse_course_md(course_index, code_language)[1]
         # Fallback if chapter not found
-        return f"Chapter {part_index}.{chapter_index}", None
+        return chapters.get((part_index, chapter_index),
+                            (f"Chapter {part_index}.{chapter_index}", None))
 
     def generate_video_title(self, course_index: str, part_index: int,
-                            chapter_index: int, chapter_title: str) -> str:
+                            chapter_index: int, chapter_title: str,
+                            course_display: Optional[str] = None) -> str:
         """
         Generate video title following the template:
         [BTC 101] - 2.2 - Chapter Title
+
+        course_display can be passed when the caller already formatted the course index.
         """
-        # Convert course index to display format (btc101 -> BTC 101)
-        course_display = course_index.upper()
-        if course_display.startswith('BTC') and len(course_display) > 3:
-            course_display = f"{course_display[:3]} {course_display[3:]}"
+        if course_display is None:
+            course_display = _course_display(course_index)
 
         return f"[{course_display}] - {part_index}.{chapter_index} - {chapter_title}"
 
-    def generate_video_description(self, course_index: str, course_title: str) -> str:
+    def generate_video_description(self, course_index: str, course_title: str,
+                                   course_display: Optional[str] = None) -> str:
         """
         Generate video description following the template:
         {course index upper case with space} - {course title in code_language}
@@ -205,9 +372,8 @@ class MetadataExtractor:
         Note: This returns ONLY the base description without footer.
         Footer should be appended during upload.
         """
-        course_display = course_index.upper()
-        if course_display.startswith('BTC') and len(course_display) > 3:
-            course_display = f"{course_display[:3]} {course_display[3:]}"
+        if course_display is None:
+            course_display = _course_display(course_index)
 
         return f"{course_display} - {course_title}"
 
@@ -216,39 +382,17 @@ class MetadataExtractor:
         """
         Get the standard footer to be appended to video descriptions during upload
         """
-        return """
-—
-Plan ₿ Network  — Scaling Bitcoin Adoption
-
-Level up your Bitcoin knowledge and Explore all our free, open‑source courses on the platform:
-https://planb.network
-
-Follow us on social:
-Twitter: @planb_network
-
-⚠️ Disclaimer & Risk Warning
-
-Cryptocurrencies are risky. All content is for educational and informational purposes only and does not constitute financial advice. Consult a licensed financial adviser before making any significant financial decisions. Bitcoin is highly volatile and speculative; investing can lead to losses. Never invest more than you can afford to lose. Past performance is not indicative of future results.
-
-The crypto industry contains scams—verify sources and do your own research. Do not trust anyone blindly, including us. We do not partner with any altcoin projects. Our content is free and open source under the CC BY-SA license. We are independent and have no obligations or contracts with any cryptocurrency or ICO.
+        return DESCRIPTION_FOOTER
 
-We will never ask for your private information (seed phrase, private keys, name, address, KYC). We are not responsible for losses due to scams, key mismanagement, or poor investments.
-
-More info:
-
-💻 https://planb.network/about
-
-📬 contact@planb.network
-
-—"""
-
-    def extract_metadata(self, video_filename: str, video_file_path: Optional[Path] = None) -> VideoMetadata:
+    def extract_metadata(self, video_filename: str, video_file_path: Optional[Path] = None,
+                         sha256_hash: Optional[str] = None) -> VideoMetadata:
         """
         Extract all metadata from a video filename
         
         Args:
             video_filename: Name of the video file
             video_file_path: Optional full path to calculate SHA256 hash
+            sha256_hash: Already known hash of the file, skips reading it
         """
         try:
             # Parse filename
@@ -259,14 +403,15 @@ More info:
             chapter_title, video_id = self.get_chapter_title(course_index, part_index,
                                                              chapter_index, code_language)
 
-            # Generate video title and description
+            # Generate video title and description from one formatted course index
+            course_display = _course_display(course_index)
             video_title = self.generate_video_title(course_index, part_index,
-                                                   chapter_index, chapter_title)
-            video_description = self.generate_video_description(course_index, course_title)
+                                                   chapter_index, chapter_title, course_display)
+            video_description = self.generate_video_description(course_index, course_title,
+                                                               course_display)
 
-            # Calculate SHA256 hash if file path provided
-            sha256_hash = None
-            if video_file_path and video_file_path.exists():
+            # Calculate SHA256 hash if file path provided and not already known
+            if not sha256_hash and video_file_path and video_file_path.exists():
                 sha256_hash = self.calculate_file_hash(video_file_path)
 
             return VideoMetadata(
@@ -285,23 +430,128 @@ More info:
         except Exception as e:
             raise Exception(f"Error processing {video_filename}: {str(e)}")
 
-    def process_videos_in_folder(self, folder_path: Path) -> List[VideoMetadata]:
+    def get_cached_metadata(self, video_file: Path, stat_result: os.stat_result,
+                            cache: Dict[str, VideoMetadata],
+                            cache_mtime: float) -> Optional[VideoMetadata]:
+        """
+        Reuse a complete metadata.json record if nothing it depends on changed since it was saved
+
+        The record is keyed by filename only, so it is trusted only when the hash
+        cache holds this exact file (absolute path, size, mtime) with the same hash.
+
+        Args:
+            video_file: Path to the video file
+            stat_result: Current stat of the video file
+            cache: Existing metadata keyed by filename
+            cache_mtime: Modification time of the metadata.json the cache was loaded from
+
+        Returns:
+            Copy of the cached VideoMetadata (without platform IDs), or None if it must be extracted
+        """
+        cached = cache.get(video_file.name)
+        if not cached or not cached.video_id or not cached.sha256_hash:
+            return None
+
+        entry = self.hash_cache.get(str(video_file.absolute()))
+        if entry != [stat_result.st_mtime_ns, stat_result.st_size, cached.sha256_hash]:
+            return None
+
+        # Titles come from the course markdown, which may have changed since
+        md_file = self.courses_dir / cached.course_index / f"{cached.code_language}.md"
+        try:
+            if md_file.stat().st_mtime > cache_mtime:
+                return None
+        except OSError:
+            return None
+
+        # Platform IDs are resolved by the orchestrator, like for freshly extracted metadata
+        return replace(cached, youtube_id=None, peertube_id=None,
+                       file_size=stat_result.st_size, file_mtime_ns=stat_result.st_mtime_ns)
+
+    def _prefetch_course_mds(self, video_filenames, max_workers: int = 8):
+        """
+        Read and parse the course markdown files of several videos concurrently
+
+        Each (course, language) file is parsed once by one thread; the per-video
+        extraction afterwards only hits the cache. Errors are left for extract_metadata
+        to report.
+
+        Args:
+            video_filenames: Names of the video files about to be extracted
+            max_workers: Maximum number of reader threads
+        """
+        keys = set()
+        for video_filename in video_filenames:
+            try:
+                course_index, _, _, code_language = self.parse_filename(video_filename)
+            except ValueError:
+                continue
+            if (course_index, code_language) not in self._course_md_cache:
+                keys.add((course_index, code_language))
+
+        if len(keys) < 2:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            # Keys are distinct, so threads never parse or store the same entry
+            for future in [executor.submit(self._parse_course_md, *key) for key in keys]:
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _store_hash(outcomes: list, index: int, video_file: Path, get_hash):
+        """Set the hash of a parsed video's metadata, or record the hashing error"""
+        try:
+            outcomes[index][0].sha256_hash = get_hash()
+        except Exception as e:
+            outcomes[index] = (None, f"Error processing {video_file.name}: {str(e)}")
+
+    def process_videos_in_folder(self, folder_path: Path,
+                                 cache: Optional[Dict[str, VideoMetadata]] = None,
+                                 cache_mtime: Optional[float] = None,
+                                 max_workers: Optional[int] = None) -> List[VideoMetadata]:
         """
         Process all video files in a given folder
+
+        Videos that are not served from the cache are parsed first, then hashed
+        in a thread pool, one task per file: hashlib and file reads release the
+        GIL, so threads hash in parallel without process start-up or pickling.
+        Files whose (path, mtime, size) match an entry of hash_cache are not
+        read again.
+
+        Args:
+            folder_path: Folder containing the video files
+            cache: Optional existing metadata (from metadata.json) keyed by filename;
+                   unchanged videos with a complete record skip hashing and parsing
+            cache_mtime: Modification time of the metadata.json the cache was loaded from
+            max_workers: Number of hashing threads (default: CPU count up to 8, 1 = serial)
         """
-        metadata_list = []
         errors = []
+        cached_count = 0
         console = Console()
 
-        # Find all .mp4 files in the folder and sort alphabetically
-        video_files = sorted(folder_path.glob("*.mp4"), key=lambda x: x.name)
+        # Find all .mp4 files in the folder and sort alphabetically; hidden files
+        # are skipped as glob("*.mp4") did
+        with os.scandir(folder_path) as entries:
+            video_paths = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith('.mp4') and not entry.name.startswith('.')
+                and entry.is_file()
+            )
+        video_files = [Path(path) for path in video_paths]
 
         if not video_files:
             console.print(f"[yellow]No video files found in {folder_path}[/yellow]")
-            return metadata_list
+            return []
 
         console.print(f"\n[bold cyan]Processing {len(video_files)} videos...[/bold cyan]")
 
+        # Results are stored by position so the output keeps the sorted file order
+        outcomes: List[Optional[Tuple[Optional[VideoMetadata], Optional[str]]]] = [None] * len(video_files)
+        max_workers = max_workers or min(8, os.cpu_count() or 1)
+
         # Process videos with progress bar
         with Progress(
             SpinnerColumn(),
@@ -311,32 +561,115 @@ More info:
             TextColumn("({task.completed}/{task.total})"),
             TimeRemainingColumn(),
             console=console,
-            transient=False
+            transient=False,
+            refresh_per_second=4
         ) as progress:
             task = progress.add_task("[cyan]Calculating hashes and extracting metadata...", total=len(video_files))
 
-            for video_file in video_files:
+            to_extract = []
+            # Stat and known hash of each file to extract, by position
+            stats: Dict[int, os.stat_result] = {}
+            known_hashes: Dict[int, Optional[str]] = {}
+            for index, video_file in enumerate(video_files):
                 try:
-                    # Update progress description with current file
-                    progress.update(task, description=f"[cyan]Processing: {video_file.name[:50]}...")
-
-                    metadata = self.extract_metadata(video_file.name, video_file)
-                    metadata_list.append(metadata)
+                    stat_result = video_file.stat()
+                except OSError:
+                    # Disappeared since listing: extract_metadata reports it without a hash
+                    to_extract.append(index)
+                    known_hashes[index] = None
+                    continue
 
-                    # Advance the progress bar
-                    progress.advance(task)
+                metadata = None
+                if self.fast_stat_mode and cache and cache_mtime is not None:
+                    metadata = self.get_cached_metadata(video_file, stat_result, cache, cache_mtime)
 
+                if metadata:
+                    cached_count += 1
+                    outcomes[index] = (metadata, None)
+                else:
+                    to_extract.append(index)
+                    stats[index] = stat_result
+                    known_hashes[index] = self.get_cached_hash(video_file, stat_result)
+
+                    # No hash cache entry (e.g. first run with the cache, or a record
+                    # without video_id): reuse the metadata.json hash if the record was
+                    # hashed from a file with the same size and mtime
+                    if known_hashes[index] is None and self.fast_stat_mode and cache:
+                        cached = cache.get(video_file.name)
+                        if (cached and cached.sha256_hash
+                                and cached.file_size == stat_result.st_size
+                                and cached.file_mtime_ns == stat_result.st_mtime_ns):
+                            known_hashes[index] = cached.sha256_hash
+
+            # Cache hits are counted in one progress update rather than one per file
+            progress.update(task, description="[cyan]Extracting metadata...", advance=cached_count)
+
+            self._prefetch_course_mds(video_files[index].name for index in to_extract)
+
+            # Parsing only reads the small course markdown files: do it serially
+            # here and leave the CPU-bound hashing of the videos to the pool
+            to_hash = []
+            for index in to_extract:
+                video_file = video_files[index]
+                try:
+                    metadata = self.extract_metadata(video_file.name, sha256_hash=known_hashes[index])
                 except Exception as e:
                     # Collect errors instead of printing immediately
-                    errors.append((video_file.name, str(e)))
+                    outcomes[index] = (None, str(e))
+                    continue
+
+                outcomes[index] = (metadata, None)
+                # Files whose hash is already known, or that disappeared since
+                # listing, are done after parsing
+                if not metadata.sha256_hash and index in stats:
+                    to_hash.append(index)
+
+            progress.update(task, description="[cyan]Calculating hashes...",
+                            advance=len(to_extract) - len(to_hash))
+
+            if max_workers > 1 and len(to_hash) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(to_hash))) as executor:
+                    futures = {
+                        executor.submit(MetadataExtractor.calculate_file_hash, video_files[index]): index
+                        for index in to_hash
+                    }
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        self._store_hash(outcomes, index, video_files[index], future.result)
+                        # Show the last finished file and count it in one update
+                        progress.update(task, description=f"[cyan]Hashed: {video_files[index].name[:50]}...",
+                                        advance=1)
+            else:
+                for index in to_hash:
+                    video_file = video_files[index]
+                    # Update progress description with current file
+                    progress.update(task, description=f"[cyan]Hashing: {video_file.name[:50]}...")
+                    self._store_hash(outcomes, index, video_file,
+                                     lambda: self.calculate_file_hash(video_file))
                     # Still advance progress even on error
                     progress.advance(task)
 
+        for index in to_extract:
+            metadata = outcomes[index][0]
+            if metadata and metadata.sha256_hash and index in stats:
+                metadata.file_size = stats[index].st_size
+                metadata.file_mtime_ns = stats[index].st_mtime_ns
+                self.remember_hash(video_files[index], stats[index], metadata.sha256_hash)
+
+        metadata_list = []
+        for video_file, (metadata, error) in zip(video_files, outcomes):
+            if error is None:
+                metadata_list.append(metadata)
+            else:
+                errors.append((video_file.name, error))
+
         # Report results
         success_count = len(metadata_list)
         error_count = len(errors)
 
         console.print(f"\n[green]✓ Successfully processed: {success_count} videos[/green]")
+        if cached_count:
+            console.print(f"[dim]  Skipped extraction for {cached_count} unchanged videos already in metadata.json[/dim]")
 
         # Display errors at the end if any
         if errors:
@@ -346,3 +679,4 @@ More info:
                 console.print(f"  • {filename}: {error}")
 
         return metadata_list
+
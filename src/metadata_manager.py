@@ -1,8 +1,23 @@
 import json
+import os
+import threading
+from dataclasses import fields
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.metadata_extractor import VideoMetadata
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# metadata.json record keys, in VideoMetadata declaration order
+_FIELD_NAMES = tuple(field.name for field in fields(VideoMetadata))
+
+# Identifies the video slot a record was uploaded for
+_chapter_key = attrgetter('course_index', 'part_index', 'chapter_index', 'code_language')
+
 
 class MetadataManager:
     """Manages metadata.json file as persistent storage for upload history"""
@@ -15,40 +30,83 @@ class MetadataManager:
             metadata_file: Path to metadata.json file (default: project root)
         """
         self.metadata_file = metadata_file
+        # Append-only log of updates not yet compacted into metadata.json
+        self.journal_file = metadata_file.with_suffix('.jsonl')
         self.metadata_dict: Dict[str, VideoMetadata] = {}
+        # sha256_hash -> filename of the first record with that hash, rebuilt lazily
+        self._hash_index: Optional[Dict[str, str]] = None
+        # (course, part, chapter, language) -> filename of the first matching record, rebuilt lazily
+        self._chapter_index: Optional[Dict[Tuple[str, int, int, str], str]] = None
+        # Modification time of metadata.json as loaded, before any journal compaction
+        self.loaded_mtime: Optional[float] = None
+        self._lock = threading.Lock()
+        # Append descriptor on metadata.jsonl, opened on first append and reused
+        self._fd: Optional[int] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Close the metadata.jsonl descriptor kept open by append()"""
+        fd, self._fd = getattr(self, '_fd', None), None
+        if fd is not None:
+            os.close(fd)
+
+    @staticmethod
+    def _from_dict(item: dict) -> VideoMetadata:
+        """Build VideoMetadata from a metadata.json record (unknown keys are ignored)"""
+        record = {name: item[name] for name in _FIELD_NAMES if name in item}
+        if not record.get('video_id'):
+            record['video_id'] = item.get('chapter_uuid')  # Support old field name
+        return VideoMetadata(**record)
+
+    @staticmethod
+    def _to_dict(metadata: VideoMetadata) -> dict:
+        """Build the metadata.json record for a VideoMetadata"""
+        return {name: getattr(metadata, name) for name in _FIELD_NAMES}
 
     def load(self) -> Dict[str, VideoMetadata]:
         """
         Load existing metadata from metadata.json
 
+        Records left in the metadata.jsonl journal by an earlier run are
+        replayed on top; they are folded into metadata.json by the next save(),
+        so a run rewrites the file at most once.
+
         Returns:
             Dictionary mapping filename to VideoMetadata
         """
-        if not self.metadata_file.exists():
+        if not self.metadata_file.exists() and not self.journal_file.exists():
             return {}
 
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            for item in data:
-                metadata = VideoMetadata(
-                    filename=item['filename'],
-                    course_index=item['course_index'],
-                    part_index=item['part_index'],
-                    chapter_index=item['chapter_index'],
-                    code_language=item['code_language'],
-                    title=item['title'],
-                    description=item['description'],
-                    chapter_title=item['chapter_title'],
-                    course_title=item['course_title'],
-                    video_id=item.get('video_id') or item.get('chapter_uuid'),  # Support old field name
-                    youtube_id=item.get('youtube_id'),
-                    peertube_id=item.get('peertube_id'),
-                    sha256_hash=item.get('sha256_hash')
-                )
-                self.metadata_dict[item['filename']] = metadata
+            if self.metadata_file.exists():
+                self.loaded_mtime = self.metadata_file.stat().st_mtime
+                data = self._loads(self.metadata_file.read_bytes())
+
+                for item in data:
+                    self.metadata_dict[item['filename']] = self._from_dict(item)
+
+            if self.journal_file.exists():
+                with open(self.journal_file, 'rb') as f:
+                    for line in f:
+                        if not line.strip():
+                            continue
+                        try:
+                            item = self._loads(line)
+                        except ValueError:
+                            # Partially written last record of an interrupted run
+                            continue
+                        self.metadata_dict[item['filename']] = self._from_dict(item)
 
+            self._hash_index = None
+            self._chapter_index = None
             return self.metadata_dict
 
         except Exception as e:
@@ -57,31 +115,112 @@ class MetadataManager:
 
     def save(self, metadata_list: List[VideoMetadata]):
         """
-        Save metadata list to metadata.json
+        Save metadata list to metadata.json and clear the metadata.jsonl journal
+
+        The file is written to a temporary sibling and renamed over
+        metadata.json, so a crash never leaves a truncated file behind.
 
         Args:
             metadata_list: List of VideoMetadata objects to save
         """
-        metadata_dict = []
-        for metadata in metadata_list:
-            metadata_dict.append({
-                'filename': metadata.filename,
-                'course_index': metadata.course_index,
-                'part_index': metadata.part_index,
-                'chapter_index': metadata.chapter_index,
-                'code_language': metadata.code_language,
-                'title': metadata.title,
-                'description': metadata.description,
-                'chapter_title': metadata.chapter_title,
-                'course_title': metadata.course_title,
-                'video_id': metadata.video_id,
-                'youtube_id': metadata.youtube_id,
-                'peertube_id': metadata.peertube_id,
-                'sha256_hash': metadata.sha256_hash
-            })
-
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata_dict, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson serializes the dataclasses directly, fields in declaration
+            # order, as the same 2-space indented UTF-8 as json.dumps below
+            payload = orjson.dumps(metadata_list, option=orjson.OPT_INDENT_2)
+        else:
+            metadata_dict = [self._to_dict(metadata) for metadata in metadata_list]
+            payload = json.dumps(metadata_dict, indent=2, ensure_ascii=False).encode('utf-8')
+
+        tmp_file = self.metadata_file.with_name(self.metadata_file.name + '.tmp')
+
+        with self._lock:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                self._write_all(fd, payload)
+                getattr(os, 'fdatasync', os.fsync)(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.metadata_file)
+
+            # Everything journaled so far is now part of metadata.json
+            self.close()
+            self.journal_file.unlink(missing_ok=True)
+
+    def append(self, metadata: VideoMetadata):
+        """
+        Update metadata for a video and append it to the metadata.jsonl journal
+
+        Only the changed record is written; metadata.json itself is rewritten
+        on the next save() or load().
+
+        Args:
+            metadata: VideoMetadata to record
+        """
+        if orjson is not None:
+            line = orjson.dumps(metadata) + b"\n"
+        else:
+            line = (json.dumps(self._to_dict(metadata), ensure_ascii=False) + "\n").encode('utf-8')
+
+        with self._lock:
+            self._store(metadata)
+            if self._fd is None:
+                self._fd = os.open(self.journal_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._write_all(self._fd, line)
+
+    @staticmethod
+    def _write_all(fd: int, payload: bytes):
+        """Write the whole payload to a descriptor, looping over short writes"""
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+
+    @staticmethod
+    def _loads(data: bytes):
+        """Parse JSON bytes, with orjson when available"""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def _store(self, metadata: VideoMetadata):
+        """Insert or replace a record, keeping the lookup indexes in sync (caller holds the lock)"""
+        previous = self.metadata_dict.get(metadata.filename)
+        self.metadata_dict[metadata.filename] = metadata
+
+        # A record that changes key keeps its position in the dict: rebuild on next lookup.
+        # New records go last, so an earlier record with the same key still wins.
+        if self._hash_index is not None:
+            if previous is not None and previous.sha256_hash != metadata.sha256_hash:
+                self._hash_index = None
+            elif metadata.sha256_hash:
+                self._hash_index.setdefault(metadata.sha256_hash, metadata.filename)
+
+        if self._chapter_index is not None:
+            key = _chapter_key(metadata)
+            if previous is not None and _chapter_key(previous) != key:
+                self._chapter_index = None
+            else:
+                self._chapter_index.setdefault(key, metadata.filename)
+
+    def _get_hash_index(self) -> Dict[str, str]:
+        """Return the sha256_hash -> filename index, building it if needed"""
+        index = self._hash_index
+        if index is None:
+            index = {}
+            for filename, metadata in self.metadata_dict.items():
+                if metadata.sha256_hash:
+                    index.setdefault(metadata.sha256_hash, filename)
+            self._hash_index = index
+        return index
+
+    def _get_chapter_index(self) -> Dict[Tuple[str, int, int, str], str]:
+        """Return the (course, part, chapter, language) -> filename index, building it if needed"""
+        index = self._chapter_index
+        if index is None:
+            index = {}
+            for filename, metadata in self.metadata_dict.items():
+                index.setdefault(_chapter_key(metadata), filename)
+            self._chapter_index = index
+        return index
 
     def get_existing_metadata(self, filename: str) -> Optional[VideoMetadata]:
         """
@@ -121,10 +260,9 @@ class MetadataManager:
         Returns:
             VideoMetadata if found, None otherwise
         """
-        for metadata in self.metadata_dict.values():
-            if metadata.sha256_hash == sha256_hash:
-                return metadata
-        return None
+        with self._lock:
+            filename = self._get_hash_index().get(sha256_hash)
+        return self.metadata_dict.get(filename) if filename else None
 
     def is_hash_uploaded(self, sha256_hash: str) -> bool:
         """
@@ -156,13 +294,11 @@ class MetadataManager:
         Returns:
             VideoMetadata if found, None otherwise
         """
-        for metadata in self.metadata_dict.values():
-            if (metadata.course_index == course_index and
-                metadata.part_index == part_index and
-                metadata.chapter_index == chapter_index and
-                metadata.code_language == code_language):
-                return metadata
-        return None
+        with self._lock:
+            filename = self._get_chapter_index().get(
+                (course_index, part_index, chapter_index, code_language)
+            )
+        return self.metadata_dict.get(filename) if filename else None
 
     def update_metadata(self, metadata: VideoMetadata):
         """
@@ -171,4 +307,5 @@ class MetadataManager:
         Args:
             metadata: VideoMetadata to update
         """
-        self.metadata_dict[metadata.filename] = metadata
+        with self._lock:
+            self._store(metadata)
@@ -1,16 +1,111 @@
+import io
+import json
+import os
+import random
+import threading
+import time
 import requests
 import urllib3
+from contextlib import ExitStack
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urljoin
 from dataclasses import dataclass
 import logging
 from .thumbnail_generator import ThumbnailGenerator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 # Disable SSL warnings when SSL verification is disabled
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Access tokens are shared between runs (main.py and the batch scripts) until they expire
+TOKEN_CACHE_FILE = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'auto-video-uploader' / 'peertube_token.json'
+
+# OAuth client credentials of each instance, saving the oauth-clients/local lookup on login
+CLIENT_CACHE_FILE = TOKEN_CACHE_FILE.with_name('peertube_clients.json')
+
+# Don't reuse a cached token that expires within this many seconds
+TOKEN_EXPIRY_MARGIN = 60
+
+# Responses meaning the instance is overloaded: the upload can be retried later
+OVERLOAD_STATUS_CODES = (429, 503)
+
+# Connection resets and transient errors from the instance or its reverse proxy
+# are retried with exponential backoff (1, 2, 4, 8 s), honouring Retry-After,
+# for metadata reads and deletes only. POST and PUT are left out: a streamed
+# upload body cannot be replayed, creating a playlist twice is not harmless,
+# and resumable upload chunks retry themselves after asking the server how much
+# it received (their 429/503 must also reach the overload handling). After the
+# last attempt the response is returned so callers still see its status.
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS', 'DELETE']),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Playlists requested per page when searching playlists by name
+PLAYLIST_PAGE_SIZE = 100
+
+# Size of each request of a resumable video upload
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Consecutive failed attempts at a chunk before a resumable upload is abandoned
+RESUMABLE_MAX_RETRIES = 5
+
+
+def _read_cache(path: Path) -> dict:
+    """Read a JSON cache file, or return an empty cache if it is missing or invalid"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_cache(path: Path, cache: dict):
+    """Atomically replace a JSON cache file, readable by the owner only (mode 0600)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = path.with_name(path.name + '.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, path)
+    except OSError as e:
+        logger.debug("Could not save PeerTube cache %s: %s", path, e)
+
+
+def _response_json(response: requests.Response):
+    """Decode a JSON response body, with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Seconds to wait given by a Retry-After header (HTTP dates are ignored)"""
+    try:
+        return float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return None
+
 
 @dataclass
 class PeerTubeUploadResult:
@@ -18,10 +113,18 @@ class PeerTubeUploadResult:
     video_id: Optional[str] = None
     video_url: Optional[str] = None
     error: Optional[str] = None
+    status_code: Optional[int] = None  # HTTP status of a failed upload
+    retry_after: Optional[float] = None  # Retry-After of a failed upload, in seconds
+
+    @property
+    def overloaded(self) -> bool:
+        """Whether the upload was refused because the instance is overloaded"""
+        return self.status_code in OVERLOAD_STATUS_CODES
 
 
 class PeerTubeUploader:
-    def __init__(self, instance_url: str, username: str, password: str, upload_endpoint: Optional[str] = None, verify_ssl: bool = True):
+    def __init__(self, instance_url: str, username: str, password: str, upload_endpoint: Optional[str] = None, verify_ssl: bool = True,
+                 max_connections: int = 10, session: Optional[requests.Session] = None):
         """
         Initialize PeerTube uploader
 
@@ -32,6 +135,10 @@ class PeerTubeUploader:
             upload_endpoint: Optional upload endpoint URL (e.g., https://upload.peertube.example.com)
                            If not provided, uses instance_url for uploads
             verify_ssl: Whether to verify SSL certificates (default: True)
+            max_connections: Maximum number of pooled connections used for concurrent uploads (default: 10)
+            session: Optional existing session to share with the caller (e.g. the thumbnail
+                     updater), so both reuse the same connections and authorization header;
+                     it is left open by close()
         """
         self.instance_url = instance_url.rstrip('/')
         self.upload_endpoint = upload_endpoint.rstrip('/') if upload_endpoint else self.instance_url
@@ -39,21 +146,182 @@ class PeerTubeUploader:
         self.password = password
         self.verify_ssl = verify_ssl
         self.access_token = None
+        self.token_expires_at: Optional[float] = None
+        self.refresh_token: Optional[str] = None
+        self._token_lock = threading.Lock()
         self.client_id = None
         self.client_secret = None
+        # Resolved once per authentication instead of on every upload/playlist call
+        self._default_channel_id: Optional[int] = None
+        self._account_info: Optional[dict] = None
+        # Playlist display name -> ID, for playlists found or created by this instance
+        self._playlist_ids: Dict[str, str] = {}
+
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            # Every API call and upload goes through one connection pool, so an
+            # upload sequence (auth, channel, upload, playlist) reuses TLS
+            # connections; pool_block caps open connections per host.
+            self.session = requests.Session()
+            # Applies to every call, not only those passing verify= (login, lookups)
+            self.session.verify = verify_ssl
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=max_connections,
+                pool_block=True,
+                max_retries=HTTP_RETRY
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release the pooled connections (a session passed in by the caller is left open)"""
+        if self._owns_session:
+            self.session.close()
+
+    def _token_cache_key(self) -> str:
+        """Cached tokens are per instance and account"""
+        return f"{self.instance_url}|{self.username}"
+
+    def _load_cached_token(self) -> Optional[dict]:
+        """
+        Return a still valid access token saved by a previous run
+
+        Returns:
+            Cache entry with 'access_token' and 'expires_at', or None if there is
+            none or it is about to expire
+        """
+        entry = _read_cache(TOKEN_CACHE_FILE).get(self._token_cache_key())
+        if not entry or not entry.get('access_token') or entry.get('expires_at', 0) <= time.time() + TOKEN_EXPIRY_MARGIN:
+            return None
+        return entry
+
+    def _save_cached_token(self, token_json: dict):
+        """
+        Save a freshly obtained access token for the next runs (file mode 0600)
+
+        Args:
+            token_json: Response of the /users/token endpoint
+        """
+        expires_in = token_json.get('expires_in')
+        if not expires_in:
+            return
+
+        cache = _read_cache(TOKEN_CACHE_FILE)
+        cache[self._token_cache_key()] = {
+            'access_token': token_json['access_token'],
+            'expires_at': time.time() + expires_in
+        }
+        _write_cache(TOKEN_CACHE_FILE, cache)
+
+    def _forget_cached_token(self):
+        """Drop this account's token from the cache and stop sending it"""
+        self.access_token = None
+        self.token_expires_at = None
+        self.session.headers.pop('Authorization', None)
+
+        cache = _read_cache(TOKEN_CACHE_FILE)
+        if cache.pop(self._token_cache_key(), None) is not None:
+            _write_cache(TOKEN_CACHE_FILE, cache)
+
+    def _load_client_creds(self) -> Optional[Tuple[str, str]]:
+        """
+        Return the instance's OAuth client credentials saved by a previous run
+
+        Returns:
+            (client_id, client_secret), or None if they are not cached
+        """
+        entry = _read_cache(CLIENT_CACHE_FILE).get(self.instance_url)
+        if not entry or not entry.get('client_id') or not entry.get('client_secret'):
+            return None
+        return entry['client_id'], entry['client_secret']
+
+    def _save_client_creds(self, client_id: Optional[str] = None, client_secret: Optional[str] = None):
+        """
+        Save the instance's OAuth client credentials for the next runs, or forget them
+
+        Args:
+            client_id: Client ID (None removes the cached entry)
+            client_secret: Client secret
+        """
+        cache = _read_cache(CLIENT_CACHE_FILE)
+        if client_id is None:
+            if cache.pop(self.instance_url, None) is None:
+                return
+        else:
+            cache[self.instance_url] = {'client_id': client_id, 'client_secret': client_secret}
+        _write_cache(CLIENT_CACHE_FILE, cache)
+
+    def authenticate(self, use_cached_token: bool = True) -> bool:
+        """
+        Authenticate with PeerTube instance
+
+        Args:
+            use_cached_token: Reuse an unexpired token from a previous run instead of logging in
+
+        Returns:
+            True if authenticated, False otherwise
+        """
+        self._default_channel_id = None
+        self._account_info = None
+
+        if use_cached_token:
+            cached_token = self._load_cached_token()
+            if cached_token:
+                self._set_access_token(cached_token['access_token'], cached_token['expires_at'])
+                if self._token_accepted():
+                    return True
+
+                # Revoked before it expired (password change, logout, instance reset)
+                logger.debug("Cached PeerTube token rejected, logging in again")
+                self._forget_cached_token()
+
+        return self._login()
 
-    def authenticate(self) -> bool:
-        """Authenticate with PeerTube instance"""
+    def _token_accepted(self) -> bool:
+        """
+        Check the current access token with one cheap authenticated request
+
+        Returns:
+            False if the instance rejects the token (401) or can't be reached
+        """
         try:
-            # Get client credentials
-            client_response = requests.get(f"{self.instance_url}/api/v1/oauth-clients/local")
+            response = self.session.get(f"{self.instance_url}/api/v1/users/me")
+        except requests.exceptions.RequestException as e:
+            logger.debug("Could not check cached PeerTube token: %s", e)
+            return False
+        return response.status_code != 401
 
-            if client_response.status_code != 200:
-                raise Exception(f"Failed to get client credentials: {client_response.text}")
+    def _login(self) -> bool:
+        """
+        Get an access token with the username and password
+
+        Returns:
+            True if authenticated, False otherwise
+        """
+        try:
+            # Get client credentials (they only change if the instance is reinstalled)
+            cached_creds = self._load_client_creds()
+            if cached_creds:
+                self.client_id, self.client_secret = cached_creds
+            else:
+                client_response = self.session.get(f"{self.instance_url}/api/v1/oauth-clients/local")
 
-            client_data = client_response.json()
-            self.client_id = client_data['client_id']
-            self.client_secret = client_data['client_secret']
+                if client_response.status_code != 200:
+                    raise Exception(f"Failed to get client credentials: {client_response.text}")
+
+                client_data = _response_json(client_response)
+                self.client_id = client_data['client_id']
+                self.client_secret = client_data['client_secret']
+                self._save_client_creds(self.client_id, self.client_secret)
 
             # Get access token
             token_data = {
@@ -65,16 +333,20 @@ class PeerTubeUploader:
                 'password': self.password
             }
 
-            token_response = requests.post(
+            token_response = self.session.post(
                 f"{self.instance_url}/api/v1/users/token",
                 data=token_data
             )
 
+            if token_response.status_code in [400, 401] and cached_creds:
+                # Cached client credentials no longer valid: fetch them again, once
+                self._save_client_creds(None)
+                return self._login()
+
             if token_response.status_code != 200:
                 raise Exception(f"Authentication failed: {token_response.text}")
 
-            token_json = token_response.json()
-            self.access_token = token_json['access_token']
+            self._use_token_response(_response_json(token_response))
 
             return True
 
@@ -82,6 +354,116 @@ class PeerTubeUploader:
             print(f"PeerTube authentication error: {str(e)}")
             return False
 
+    def _refresh_access_token(self) -> bool:
+        """
+        Get a new access token with the refresh_token grant (no password login)
+
+        Returns:
+            True if the token was refreshed, False otherwise
+        """
+        token_data = {
+            'client_id': self.client_id,
+            'client_secret': self.client_secret,
+            'grant_type': 'refresh_token',
+            'refresh_token': self.refresh_token
+        }
+
+        try:
+            token_response = self.session.post(
+                f"{self.instance_url}/api/v1/users/token",
+                data=token_data
+            )
+        except requests.exceptions.RequestException as e:
+            logger.debug("PeerTube token refresh failed: %s", e)
+            return False
+
+        if token_response.status_code != 200:
+            logger.debug("PeerTube token refresh failed: %s", token_response.status_code)
+            return False
+
+        self._use_token_response(_response_json(token_response))
+        return True
+
+    def _ensure_token(self):
+        """
+        Renew the access token when it is about to expire
+
+        Uses the refresh token when there is one, and logs in again otherwise
+        (e.g. for a token reused from the cache of an earlier run).
+        """
+        expires_at = self.token_expires_at
+        if expires_at is None or time.time() < expires_at - TOKEN_EXPIRY_MARGIN:
+            return
+
+        with self._token_lock:
+            # Another upload thread may have renewed it in the meantime
+            if self.token_expires_at != expires_at:
+                return
+            if self.refresh_token and self.client_id and self._refresh_access_token():
+                return
+            self._login()
+
+    def _use_token_response(self, token_json: dict):
+        """
+        Use the token returned by the /users/token endpoint and cache it for the next runs
+
+        Args:
+            token_json: Response of the /users/token endpoint
+        """
+        expires_in = token_json.get('expires_in')
+        self._set_access_token(
+            token_json['access_token'],
+            time.time() + expires_in if expires_in else None,
+            token_json.get('refresh_token')
+        )
+        self._save_cached_token(token_json)
+
+    def _set_access_token(self, access_token: str, expires_at: Optional[float] = None,
+                          refresh_token: Optional[str] = None):
+        """
+        Use a new access token, also for every request made through the session
+
+        Args:
+            access_token: OAuth access token
+            expires_at: Time (time.time()) at which the token expires, if known
+            refresh_token: Refresh token issued with it, if any
+        """
+        self.access_token = access_token
+        self.token_expires_at = expires_at
+        self.refresh_token = refresh_token
+        self.session.headers['Authorization'] = f'Bearer {access_token}'
+
+    def _get_default_channel_id(self) -> Optional[int]:
+        """
+        Resolve the account's default channel, looking it up only once
+
+        Returns:
+            Channel ID, or None if the account has no channel or the lookup failed
+        """
+        if self._default_channel_id is not None:
+            return self._default_channel_id
+
+        channel_response = self.session.get(
+            f"{self.instance_url}/api/v1/video-channels/{self.username}_channel"
+        )
+
+        if channel_response.status_code == 200:
+            channel_id = _response_json(channel_response)['id']
+        else:
+            # Fallback: get user's channels
+            channels_response = self.session.get(
+                f"{self.instance_url}/api/v1/accounts/{self.username}/video-channels"
+            )
+            if channels_response.status_code != 200:
+                return None
+            channels = _response_json(channels_response)['data']
+            if not channels:
+                return None
+            channel_id = channels[0]['id']
+
+        self._default_channel_id = channel_id
+        return channel_id
+
     def get_playlist_by_name(self, display_name: str) -> Optional[str]:
         """
         Find a playlist by display name
@@ -95,35 +477,46 @@ class PeerTubeUploader:
         if not self.access_token:
             return None
 
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
+        playlist_id = self._playlist_ids.get(display_name)
+        if playlist_id is not None:
+            return playlist_id
 
-            # Get account name
-            account_response = requests.get(
-                f"{self.instance_url}/api/v1/accounts/{self.username}",
-                headers=headers
-            )
+        self._ensure_token()
 
-            if account_response.status_code != 200:
-                return None
+        try:
+            # Check the account exists (once; the result is kept)
+            if self._account_info is None:
+                account_response = self.session.get(
+                    f"{self.instance_url}/api/v1/accounts/{self.username}"
+                )
 
-            # Get playlists for this account
-            playlists_response = requests.get(
-                f"{self.instance_url}/api/v1/accounts/{self.username}/video-playlists",
-                headers=headers
-            )
+                if account_response.status_code != 200:
+                    return None
+                self._account_info = _response_json(account_response)
+
+            # Get playlists for this account whose name contains display_name,
+            # page by page (the server filters, the exact match is checked here)
+            params = {'search': display_name, 'count': PLAYLIST_PAGE_SIZE, 'start': 0}
+            while True:
+                playlists_response = self.session.get(
+                    f"{self.instance_url}/api/v1/accounts/{self.username}/video-playlists",
+                    params=params
+                )
 
-            if playlists_response.status_code != 200:
-                return None
+                if playlists_response.status_code != 200:
+                    return None
 
-            playlists = playlists_response.json().get('data', [])
-            for playlist in playlists:
-                if playlist.get('displayName') == display_name:
-                    return str(playlist.get('id'))
+                page = _response_json(playlists_response)
+                playlists = page.get('data', [])
+                for playlist in playlists:
+                    if playlist.get('displayName') == display_name:
+                        playlist_id = str(playlist.get('id'))
+                        self._playlist_ids[display_name] = playlist_id
+                        return playlist_id
 
-            return None
+                params['start'] += len(playlists)
+                if not playlists or params['start'] >= page.get('total', 0):
+                    return None
 
         except Exception as e:
             print(f"  Warning: Failed to search playlists: {str(e)}")
@@ -144,34 +537,13 @@ class PeerTubeUploader:
         if not self.access_token:
             return None
 
+        self._ensure_token()
+
         try:
             # Get default channel
-            channel_response = requests.get(
-                f"{self.instance_url}/api/v1/video-channels/{self.username}_channel",
-                headers={'Authorization': f'Bearer {self.access_token}'}
-            )
-
-            if channel_response.status_code != 200:
-                # Fallback: get user's channels
-                channels_response = requests.get(
-                    f"{self.instance_url}/api/v1/accounts/{self.username}/video-channels",
-                    headers={'Authorization': f'Bearer {self.access_token}'}
-                )
-                if channels_response.status_code == 200:
-                    channels = channels_response.json()['data']
-                    if channels:
-                        video_channel_id = channels[0]['id']
-                    else:
-                        return None
-                else:
-                    return None
-            else:
-                video_channel_id = channel_response.json()['id']
-
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
+            video_channel_id = self._get_default_channel_id()
+            if video_channel_id is None:
+                return None
 
             body = {
                 "displayName": display_name,
@@ -180,15 +552,15 @@ class PeerTubeUploader:
                 "videoChannelId": video_channel_id
             }
 
-            response = requests.post(
+            response = self._post_json(
                 f"{self.instance_url}/api/v1/video-playlists",
-                headers=headers,
-                json=body
+                body
             )
 
             if response.status_code in [200, 201]:
-                playlist_data = response.json()
+                playlist_data = _response_json(response)
                 playlist_id = str(playlist_data['videoPlaylist']['id'])
+                self._playlist_ids[display_name] = playlist_id
                 print(f"  ✅ PeerTube: Created playlist '{display_name}' ({playlist_id})")
                 return playlist_id
             else:
@@ -213,20 +585,16 @@ class PeerTubeUploader:
         if not self.access_token:
             return False
 
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
+        self._ensure_token()
 
+        try:
             body = {
                 "videoId": video_id
             }
 
-            response = requests.post(
+            response = self._post_json(
                 f"{self.instance_url}/api/v1/video-playlists/{playlist_id}/videos",
-                headers=headers,
-                json=body
+                body
             )
 
             if response.status_code in [200, 201]:
@@ -254,14 +622,11 @@ class PeerTubeUploader:
             print("  Not authenticated. Call authenticate() first.")
             return False
 
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
+        self._ensure_token()
 
-            response = requests.delete(
-                f"{self.instance_url}/api/v1/videos/{video_id}",
-                headers=headers
+        try:
+            response = self.session.delete(
+                f"{self.instance_url}/api/v1/videos/{video_id}"
             )
 
             if response.status_code == 204:
@@ -275,7 +640,14 @@ class PeerTubeUploader:
             print(f"  ❌ PeerTube: Failed to delete video {video_id}: {str(e)}")
             return False
 
-    def upload_thumbnail(self, video_uuid: str, thumbnail_path: Path) -> bool:
+    @staticmethod
+    def _open_thumbnail(thumbnail: Union[Path, bytes]):
+        """Open a thumbnail given as a file path or as in-memory image bytes"""
+        if isinstance(thumbnail, (bytes, bytearray)):
+            return io.BytesIO(thumbnail)
+        return open(thumbnail, 'rb')
+
+    def upload_thumbnail(self, video_uuid: str, thumbnail_path: Union[Path, bytes]) -> bool:
         """
         Upload a thumbnail image for a video using the PUT /api/v1/videos/{id} endpoint.
         
@@ -284,7 +656,7 @@ class PeerTubeUploader:
         
         Args:
             video_uuid: Video UUID or shortUUID
-            thumbnail_path: Path to thumbnail image file
+            thumbnail_path: Path to thumbnail image file, or the JPEG bytes themselves
             
         Returns:
             True if upload successful, False otherwise
@@ -292,24 +664,23 @@ class PeerTubeUploader:
         if not self.access_token:
             logger.error("Not authenticated. Call authenticate() first.")
             return False
+
+        self._ensure_token()
         
-        if not thumbnail_path.exists():
-            logger.error(f"Thumbnail file not found: {thumbnail_path}")
+        in_memory = isinstance(thumbnail_path, (bytes, bytearray))
+        if not in_memory and not thumbnail_path.exists():
+            logger.error("Thumbnail file not found: %s", thumbnail_path)
             return False
         
         # Check file size (PeerTube limit is 4MB for thumbnails)
-        file_size = thumbnail_path.stat().st_size
+        file_size = len(thumbnail_path) if in_memory else thumbnail_path.stat().st_size
         if file_size > 4 * 1024 * 1024:
-            logger.error(f"Thumbnail file too large: {file_size} bytes (max 4MB)")
+            logger.error("Thumbnail file too large: %s bytes (max 4MB)", file_size)
             return False
         
         try:
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
-            
             # Open and prepare the thumbnail file
-            with open(thumbnail_path, 'rb') as f:
+            with self._open_thumbnail(thumbnail_path) as f:
                 # Use multipart/form-data with thumbnailfile field
                 # According to PeerTube OpenAPI spec:
                 # - Field name: thumbnailfile
@@ -323,59 +694,57 @@ class PeerTubeUploader:
                     )
                 }
                 
-                logger.debug(f"Uploading thumbnail: size={file_size} bytes, video_uuid={video_uuid}")
+                logger.debug("Uploading thumbnail: size=%s bytes, video_uuid=%s", file_size, video_uuid)
                 
                 # Use PUT /api/v1/videos/{id} endpoint
                 # This is the correct endpoint for updating video metadata including thumbnail
                 url = f"{self.instance_url}/api/v1/videos/{video_uuid}"
                 
-                logger.debug(f"Using PUT endpoint: {url}")
+                logger.debug("Using PUT endpoint: %s", url)
                 
-                response = requests.put(
+                response = self.session.put(
                     url,
-                    headers=headers,
                     files=files,
                     verify=self.verify_ssl
                 )
             
             # Check response
             if response.status_code in [200, 201, 204]:
-                logger.info(f"  ✅ PeerTube: Thumbnail uploaded successfully")
+                logger.info("  ✅ PeerTube: Thumbnail uploaded successfully")
                 return True
             elif response.status_code == 404:
-                logger.error(f"  ❌ PeerTube: Video not found (404): {video_uuid}")
+                logger.error("  ❌ PeerTube: Video not found (404): %s", video_uuid)
                 # Try with upload endpoint if configured and different
                 if self.upload_endpoint != self.instance_url:
                     logger.debug("Trying with upload endpoint...")
-                    with open(thumbnail_path, 'rb') as f:
+                    with self._open_thumbnail(thumbnail_path) as f:
                         files = {
                             'thumbnailfile': ('thumbnail.jpg', f, 'image/jpeg')
                         }
-                        response = requests.put(
+                        response = self.session.put(
                             f"{self.upload_endpoint}/api/v1/videos/{video_uuid}",
-                            headers=headers,
                             files=files,
                             verify=self.verify_ssl
                         )
                         if response.status_code in [200, 201, 204]:
-                            logger.info(f"  ✅ PeerTube: Thumbnail uploaded successfully via upload endpoint")
+                            logger.info("  ✅ PeerTube: Thumbnail uploaded successfully via upload endpoint")
                             return True
                 return False
             elif response.status_code == 403:
-                logger.error(f"  ❌ PeerTube: Permission denied (403) - you don't have rights to update this video")
+                logger.error("  ❌ PeerTube: Permission denied (403) - you don't have rights to update this video")
                 return False
             elif response.status_code == 413:
-                logger.error(f"  ❌ PeerTube: File too large (413) - {file_size} bytes")
+                logger.error("  ❌ PeerTube: File too large (413) - %s bytes", file_size)
                 return False
             elif response.status_code == 415:
-                logger.error(f"  ❌ PeerTube: Unsupported media type (415)")
-                logger.error(f"     Ensure the file is a valid JPEG/PNG image")
+                logger.error("  ❌ PeerTube: Unsupported media type (415)")
+                logger.error("     Ensure the file is a valid JPEG/PNG image")
                 return False
             elif response.status_code == 400:
                 # Parse error message
                 error_msg = "Bad request"
                 try:
-                    error_data = response.json()
+                    error_data = _response_json(response)
                     if isinstance(error_data, dict):
                         if 'error' in error_data:
                             error_msg = error_data['error']
@@ -393,30 +762,29 @@ class PeerTubeUploader:
                 except:
                     error_msg = response.text[:500] if response.text else "No error details"
                 
-                logger.error(f"  ❌ PeerTube: Bad request (400) - {error_msg}")
+                logger.error("  ❌ PeerTube: Bad request (400) - %s", error_msg)
                 
                 # Additional debugging info
                 if "not supported" in error_msg.lower() or "too large" in error_msg.lower():
-                    logger.error(f"     File info: size={file_size} bytes, path={thumbnail_path}")
-                    logger.error(f"     Ensure file is <4MB and is a valid image format")
+                    logger.error("     File info: size=%s bytes, path=%s", file_size, '<memory>' if in_memory else thumbnail_path)
+                    logger.error("     Ensure file is <4MB and is a valid image format")
                 
                 return False
             else:
-                logger.error(f"  ❌ PeerTube: Unexpected response ({response.status_code})")
+                logger.error("  ❌ PeerTube: Unexpected response (%s)", response.status_code)
                 if response.text:
-                    logger.error(f"     Response: {response.text[:200]}")
+                    logger.error("     Response: %.200s", response.text)
                 return False
                 
         except requests.exceptions.SSLError:
-            logger.error(f"  ❌ PeerTube: SSL error - try setting PEERTUBE_VERIFY_SSL=false in .env")
+            logger.error("  ❌ PeerTube: SSL error - try setting PEERTUBE_VERIFY_SSL=false in .env")
             return False
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"  ❌ PeerTube: Connection error - {str(e)}")
+            logger.error("  ❌ PeerTube: Connection error - %s", e)
             return False
         except Exception as e:
-            logger.error(f"  ❌ PeerTube: Exception during upload: {str(e)}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.error("  ❌ PeerTube: Exception during upload: %s", e)
+            logger.debug("Thumbnail upload traceback", exc_info=True)
             return False
     
     def set_video_thumbnail_at_timestamp(self, video_path: Path, video_uuid: str, 
@@ -438,7 +806,7 @@ class PeerTubeUploader:
                 thumbnail_path = generator.extract_frame(video_path, timestamp=timestamp)
                 
                 if not thumbnail_path:
-                    logger.warning(f"Failed to extract thumbnail from {video_path}")
+                    logger.warning("Failed to extract thumbnail from %s", video_path)
                     return False
                 
                 # Upload thumbnail
@@ -448,15 +816,164 @@ class PeerTubeUploader:
                 return success
                 
         except Exception as e:
-            logger.error(f"Failed to set video thumbnail: {str(e)}")
+            logger.error("Failed to set video thumbnail: %s", e)
             return False
 
+    def _post_json(self, url: str, body: dict) -> requests.Response:
+        """
+        POST a JSON body, encoded with orjson when available
+
+        Args:
+            url: Endpoint URL
+            body: JSON-serializable request body
+
+        Returns:
+            The response
+        """
+        if orjson is None:
+            return self.session.post(url, json=body)
+        return self.session.post(url, data=orjson.dumps(body), headers={'Content-Type': 'application/json'})
+
+    def _post_multipart(self, url: str, fields: dict, files: dict) -> requests.Response:
+        """
+        POST a multipart/form-data body, streamed from the open files when possible
+
+        With requests_toolbelt the body is read from disk as it is sent, so a
+        multi-GB video is never held in memory; without it, requests builds
+        the whole body first.
+
+        Args:
+            url: Endpoint URL
+            fields: Form fields (string values)
+            files: Form files as {name: (filename, file object, content type)}
+
+        Returns:
+            The response
+        """
+        if MultipartEncoder is None:
+            return self.session.post(url, data=fields, files=files, verify=self.verify_ssl)
+
+        encoder = MultipartEncoder(fields={**fields, **files})
+        return self.session.post(
+            url,
+            data=encoder,
+            headers={'Content-Type': encoder.content_type},
+            verify=self.verify_ssl
+        )
+
+    def _upload_resumable(self, video_path: Path, fields: dict, thumbnail_file=None) -> requests.Response:
+        """
+        Upload a video through PeerTube's resumable upload endpoint
+
+        The video is sent in RESUMABLE_CHUNK_SIZE chunks. A chunk that fails
+        (connection error or 5xx) is retried with backoff from the offset the
+        server reports, so a network blip resends one chunk instead of the
+        whole video. The protocol needs chunks in order, so they are sent one
+        at a time.
+
+        Args:
+            video_path: Path to video file
+            fields: Video metadata form fields
+            thumbnail_file: Optional open thumbnail file sent with the metadata
+
+        Returns:
+            Response of the last chunk (200 with the created video), or the
+            first response that is not part of a successful upload
+        """
+        total = video_path.stat().st_size
+        init_url = f"{self.upload_endpoint}/api/v1/videos/upload-resumable"
+        files = {'thumbnailfile': ('thumbnail.jpg', thumbnail_file, 'image/jpeg')} if thumbnail_file else None
+
+        response = self.session.post(
+            init_url,
+            data={**fields, 'filename': video_path.name},
+            files=files,
+            headers={'X-Upload-Content-Length': str(total), 'X-Upload-Content-Type': 'video/mp4'},
+            verify=self.verify_ssl
+        )
+        if response.status_code not in [200, 201]:
+            return response
+
+        # Location is usually protocol-relative (//host/api/v1/...?upload_id=...)
+        upload_url = urljoin(init_url, response.headers['Location'])
+
+        offset = 0
+        failures = 0
+        with open(video_path, 'rb') as f:
+            while True:
+                # A long upload can outlive the access token
+                self._ensure_token()
+                f.seek(offset)
+                chunk = f.read(RESUMABLE_CHUNK_SIZE)
+                try:
+                    response = self.session.put(
+                        upload_url,
+                        data=chunk,
+                        headers={
+                            'Content-Type': 'application/octet-stream',
+                            'Content-Range': f"bytes {offset}-{offset + len(chunk) - 1}/{total}"
+                        },
+                        verify=self.verify_ssl,
+                        allow_redirects=False
+                    )
+                except requests.exceptions.RequestException as e:
+                    response = None
+                    error = e
+                else:
+                    if response.status_code == 308:
+                        # Chunk stored: continue after the last byte the server has
+                        offset = self._resumable_offset(response)
+                        failures = 0
+                        continue
+                    if response.status_code < 500:
+                        return response
+
+                failures += 1
+                if failures > RESUMABLE_MAX_RETRIES:
+                    try:
+                        # Let the server drop the partial upload
+                        self.session.delete(upload_url, verify=self.verify_ssl)
+                    except requests.exceptions.RequestException:
+                        pass
+                    if response is None:
+                        raise error
+                    return response
+
+                # Full jitter: uploads that failed together don't retry together
+                delay = random.uniform(0, min(2 ** failures, 60))
+                logger.debug("Resumable upload chunk at %s failed, retrying in %.1fs", offset, delay)
+                time.sleep(delay)
+
+                # Ask the server how much it received before resending
+                try:
+                    status = self.session.put(
+                        upload_url,
+                        headers={'Content-Range': f"bytes */{total}"},
+                        verify=self.verify_ssl,
+                        allow_redirects=False
+                    )
+                except requests.exceptions.RequestException:
+                    continue
+                if status.status_code == 308:
+                    offset = self._resumable_offset(status)
+                elif status.status_code in [200, 201]:
+                    return status
+
+    @staticmethod
+    def _resumable_offset(response: requests.Response) -> int:
+        """Offset to resume from, given the Range header (bytes=0-N) of a 308 response"""
+        received = response.headers.get('Range')
+        if not received:
+            return 0
+        return int(received.rsplit('-', 1)[1]) + 1
+
     def upload_video(self, video_path: Path, title: str, description: str,
                      channel_id: Optional[int] = None,
                      privacy: int = 2,  # 1=Public, 2=Unlisted, 3=Private
                      category: int = 15,  # 15=Science & Technology
                      language: str = "en",
-                     auto_thumbnail: bool = True) -> PeerTubeUploadResult:
+                     auto_thumbnail: bool = True,
+                     resumable: bool = True) -> PeerTubeUploadResult:
         """
         Upload video to PeerTube
 
@@ -469,6 +986,8 @@ class PeerTubeUploader:
             category: Category ID (15 = Science & Technology)
             language: Video language code
             auto_thumbnail: Automatically set thumbnail at 4 seconds (default: True)
+            resumable: Use the resumable upload endpoint, sending the video in chunks
+                       (default: True; falls back to a single request if unsupported)
 
         Returns:
             PeerTubeUploadResult with upload status and video info
@@ -479,6 +998,8 @@ class PeerTubeUploader:
                 error="Not authenticated. Call authenticate() first."
             )
 
+        self._ensure_token()
+
         if not video_path.exists():
             return PeerTubeUploadResult(
                 success=False,
@@ -488,28 +1009,12 @@ class PeerTubeUploader:
         try:
             # Get default channel if channel_id not provided
             if channel_id is None:
-                channel_response = requests.get(
-                    f"{self.instance_url}/api/v1/video-channels/{self.username}_channel",
-                    headers={'Authorization': f'Bearer {self.access_token}'}
-                )
-
-                if channel_response.status_code == 200:
-                    channel_id = channel_response.json()['id']
-                else:
-                    # Fallback: get user's channels
-                    channels_response = requests.get(
-                        f"{self.instance_url}/api/v1/accounts/{self.username}/video-channels",
-                        headers={'Authorization': f'Bearer {self.access_token}'}
+                channel_id = self._get_default_channel_id()
+                if channel_id is None:
+                    return PeerTubeUploadResult(
+                        success=False,
+                        error="No channels found for this account"
                     )
-                    if channels_response.status_code == 200:
-                        channels = channels_response.json()['data']
-                        if channels:
-                            channel_id = channels[0]['id']
-                        else:
-                            return PeerTubeUploadResult(
-                                success=False,
-                                error="No channels found for this account"
-                            )
 
             # Prepare video metadata
             metadata = {
@@ -535,53 +1040,59 @@ class PeerTubeUploader:
                         else:
                             print(f"  PeerTube: Warning - thumbnail extraction failed, uploading without thumbnail")
                 except Exception as e:
-                    logger.warning(f"Failed to extract thumbnail: {e}")
+                    logger.warning("Failed to extract thumbnail: %s", e)
                     thumbnail_path = None
 
-            # Prepare file upload
-            files = {
-                'videofile': (video_path.name, open(video_path, 'rb'), 'video/mp4')
-            }
-            
-            # Add thumbnail to upload if available
-            if thumbnail_path and thumbnail_path.exists():
-                files['thumbnailfile'] = ('thumbnail.jpg', open(thumbnail_path, 'rb'), 'image/jpeg')
-                print(f"  PeerTube: Including thumbnail in upload")
-
-            # Upload video
-            headers = {
-                'Authorization': f'Bearer {self.access_token}'
-            }
-
-            print(f"  PeerTube upload: Starting upload to {self.upload_endpoint}...")
-
-            response = requests.post(
-                f"{self.upload_endpoint}/api/v1/videos/upload",
-                headers=headers,
-                data=metadata,
-                files=files,
-                verify=self.verify_ssl
-            )
+            # The files stay open only for the request, and are closed on errors too
+            with ExitStack() as stack:
+                # Add thumbnail to upload if available
+                thumbnail_file = None
+                if thumbnail_path and thumbnail_path.exists():
+                    thumbnail_file = stack.enter_context(open(thumbnail_path, 'rb'))
+                    print(f"  PeerTube: Including thumbnail in upload")
+
+                # Upload video
+                print(f"  PeerTube upload: Starting upload to {self.upload_endpoint}...")
+
+                response = None
+                if resumable:
+                    response = self._upload_resumable(video_path, metadata, thumbnail_file)
+                    if response.status_code == 404:
+                        # Instance without the resumable endpoint (PeerTube < 3.3)
+                        response = None
+                        if thumbnail_file:
+                            thumbnail_file.seek(0)
+
+                if response is None:
+                    # Prepare file upload
+                    files = {
+                        'videofile': (video_path.name, stack.enter_context(open(video_path, 'rb')), 'video/mp4')
+                    }
+                    if thumbnail_file:
+                        files['thumbnailfile'] = ('thumbnail.jpg', thumbnail_file, 'image/jpeg')
+
+                    response = self._post_multipart(
+                        f"{self.upload_endpoint}/api/v1/videos/upload",
+                        metadata,
+                        files
+                    )
 
-            # Close the files
-            files['videofile'][1].close()
-            if 'thumbnailfile' in files:
-                files['thumbnailfile'][1].close()
-            
             # Clean up thumbnail temp file if it was created
             if thumbnail_path and thumbnail_path.exists():
                 try:
                     thumbnail_path.unlink()
                 except Exception as e:
-                    logger.debug(f"Failed to cleanup temp thumbnail: {e}")
+                    logger.debug("Failed to cleanup temp thumbnail: %s", e)
 
             if response.status_code not in [200, 201]:
                 return PeerTubeUploadResult(
                     success=False,
-                    error=f"Upload failed with status {response.status_code}: {response.text}"
+                    error=f"Upload failed with status {response.status_code}: {response.text}",
+                    status_code=response.status_code,
+                    retry_after=_retry_after(response)
                 )
 
-            video_data = response.json()
+            video_data = _response_json(response)
             video_uuid = video_data['video']['uuid']
             # Try to get shortUUID if available, otherwise use full UUID
             video_short_uuid = video_data['video'].get('shortUUID', video_uuid)
@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Allows bursts of up to `burst` calls, then refills at `rate` calls per
+    second. Use as a context manager to wait for a token before a call.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens (calls allowed back to back)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe concurrency limit that adapts to server overload (AIMD)
+
+    Each call that completes normally raises the limit by 1/limit (about +1
+    per `limit` calls, up to max_concurrency); a call that reports overload
+    (e.g. HTTP 429/503) multiplies it by decrease_factor. Wrap each call in
+    acquire() / release(overloaded).
+    """
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1,
+                 initial_concurrency: Optional[int] = None, decrease_factor: float = 0.5):
+        """
+        Initialize limiter
+
+        Args:
+            max_concurrency: Upper bound for concurrent calls
+            min_concurrency: Lower bound the limit never drops below
+            initial_concurrency: Starting limit (default: max_concurrency)
+            decrease_factor: Factor applied to the limit on overload
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.decrease_factor = decrease_factor
+        self.limit = float(initial_concurrency or self.max_concurrency)
+        self.active = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        """Block until fewer than `limit` calls are running, then start one"""
+        with self._condition:
+            while self.active >= int(self.limit):
+                self._condition.wait()
+            self.active += 1
+
+    def release(self, overloaded: bool = False):
+        """
+        Finish a call and adapt the limit
+
+        Args:
+            overloaded: Whether the server reported overload for this call
+        """
+        with self._condition:
+            self.active -= 1
+            if overloaded:
+                self.limit = max(self.min_concurrency, self.limit * self.decrease_factor)
+            else:
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._condition.notify_all()
@@ -1,11 +1,25 @@
+import threading
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, List, Optional, Dict, Set
 from dataclasses import dataclass
 
 from src.metadata_extractor import VideoMetadata, MetadataExtractor
-from src.youtube_uploader import YouTubeUploader, YouTubeUploadResult
-from src.peertube_uploader import PeerTubeUploader, PeerTubeUploadResult
-from src.course_yml_updater import CourseYmlUpdater
+
+# Only needed for annotations: the caller imports the uploaders it actually uses,
+# so e.g. a PeerTube-only run never loads the Google API client
+if TYPE_CHECKING:
+    from src.youtube_uploader import YouTubeUploader
+    from src.peertube_uploader import PeerTubeUploader, PeerTubeUploadResult
+    from src.course_yml_updater import CourseYmlUpdater
+
+# Uploads run in worker threads; keep their progress lines from interleaving
+_print_lock = threading.Lock()
+
+
+def _log(message: str = ""):
+    """Print a progress line atomically with respect to other upload threads"""
+    with _print_lock:
+        print(message, flush=True)
 
 
 @dataclass
@@ -20,11 +34,23 @@ class UploadResult:
     peertube_error: Optional[str] = None
 
 
+@dataclass
+class UploadPlan:
+    """Upload decision for a single video, computed before any platform call"""
+    metadata: VideoMetadata
+    video_path: Path
+    upload_to_youtube: bool = False
+    upload_to_peertube: bool = False
+    old_youtube_id: Optional[str] = None
+    old_peertube_id: Optional[str] = None
+    skip_result: Optional[UploadResult] = None
+
+
 class UploadOrchestrator:
     def __init__(self,
-                 youtube_uploader: Optional[YouTubeUploader] = None,
-                 peertube_uploader: Optional[PeerTubeUploader] = None,
-                 course_yml_updater: Optional[CourseYmlUpdater] = None):
+                 youtube_uploader: Optional['YouTubeUploader'] = None,
+                 peertube_uploader: Optional['PeerTubeUploader'] = None,
+                 course_yml_updater: Optional['CourseYmlUpdater'] = None):
         """
         Initialize upload orchestrator
 
@@ -36,6 +62,8 @@ class UploadOrchestrator:
         self.youtube_uploader = youtube_uploader
         self.peertube_uploader = peertube_uploader
         self.course_yml_updater = course_yml_updater
+        self._youtube_playlist_lock = threading.Lock()
+        self._peertube_playlist_lock = threading.Lock()
 
     def delete_existing_videos(self, metadata: VideoMetadata,
                                delete_youtube: bool = True,
@@ -49,11 +77,11 @@ class UploadOrchestrator:
             delete_peertube: Whether to delete from PeerTube
         """
         if delete_youtube and metadata.youtube_id and self.youtube_uploader:
-            print(f"  Deleting existing YouTube video...")
+            _log(f"  Deleting existing YouTube video...")
             self.youtube_uploader.delete_video(metadata.youtube_id)
 
         if delete_peertube and metadata.peertube_id and self.peertube_uploader:
-            print(f"  Deleting existing PeerTube video...")
+            _log(f"  Deleting existing PeerTube video...")
             self.peertube_uploader.delete_video(metadata.peertube_id)
 
     def upload_video(self, video_path: Path, metadata: VideoMetadata,
@@ -91,88 +119,297 @@ class UploadOrchestrator:
             metadata.youtube_id = None
             metadata.peertube_id = None
 
+        if upload_to_youtube:
+            self.upload_to_youtube(metadata, video_path, result)
+
+        if upload_to_peertube:
+            self.upload_to_peertube(metadata, video_path, result)
+
+        return result
+
+    def upload_to_youtube(self, metadata: VideoMetadata, video_path: Path,
+                          result: UploadResult,
+                          old_youtube_id: Optional[str] = None):
+        """
+        Upload a single video to YouTube and add it to its course playlist
+
+        Args:
+            metadata: Video metadata (youtube_id is updated on success)
+            video_path: Path to video file
+            result: UploadResult to fill with the YouTube status
+            old_youtube_id: Previous YouTube video to delete before uploading
+        """
+        if not self.youtube_uploader:
+            return
+
+        if old_youtube_id:
+            _log(f"  [{metadata.filename}] Deleting old YouTube video...")
+            self.youtube_uploader.delete_video(old_youtube_id)
+
         # Append footer to description for upload
-        footer = MetadataExtractor.get_description_footer()
-        full_description = f"{metadata.description}{footer}"
-
-        # Upload to YouTube
-        if upload_to_youtube and self.youtube_uploader:
-            print(f"  Uploading to YouTube...")
-            yt_result = self.youtube_uploader.upload_video(
-                video_path=video_path,
-                title=metadata.title,
-                description=full_description,
-                privacy_status="unlisted"
-            )
+        full_description = f"{metadata.description}{MetadataExtractor.get_description_footer()}"
 
-            result.youtube_success = yt_result.success
-            result.youtube_url = yt_result.video_url
-            result.youtube_error = yt_result.error
+        _log(f"  [{metadata.filename}] Uploading to YouTube...")
+        yt_result = self.youtube_uploader.upload_video(
+            video_path=video_path,
+            title=metadata.title,
+            description=full_description,
+            privacy_status="unlisted"
+        )
 
-            if yt_result.success:
-                print(f"  ✅ YouTube: {yt_result.video_url}")
-                # Update metadata with YouTube ID
-                metadata.youtube_id = yt_result.video_id
+        result.youtube_success = yt_result.success
+        result.youtube_url = yt_result.video_url
+        result.youtube_error = yt_result.error
+
+        if not yt_result.success:
+            _log(f"  [{metadata.filename}] ❌ YouTube: {yt_result.error}")
+            return
+
+        _log(f"  [{metadata.filename}] ✅ YouTube: {yt_result.video_url}")
+        # Update metadata with YouTube ID
+        metadata.youtube_id = yt_result.video_id
+
+        # Add to playlist
+        playlist_title = metadata.description  # Use base description as playlist name
+
+        # Lookup and creation must be atomic, otherwise concurrent uploads of the
+        # same course would each create their own playlist
+        with self._youtube_playlist_lock:
+            _log(f"  [{metadata.filename}] Checking for playlist: {playlist_title}")
+            playlist_id = self.youtube_uploader.get_playlist_by_title(playlist_title)
+
+            if not playlist_id:
+                _log(f"  [{metadata.filename}] Creating playlist: {playlist_title}")
+                playlist_id = self.youtube_uploader.create_playlist(
+                    title=playlist_title,
+                    description=f"Videos for {playlist_title}",
+                    privacy="unlisted"
+                )
 
-                # Add to playlist
-                playlist_title = metadata.description  # Use base description as playlist name
-                print(f"  Checking for playlist: {playlist_title}")
+        if playlist_id:
+            self.youtube_uploader.add_video_to_playlist(playlist_id, yt_result.video_id)
 
-                playlist_id = self.youtube_uploader.get_playlist_by_title(playlist_title)
+    def upload_to_peertube(self, metadata: VideoMetadata, video_path: Path,
+                           result: UploadResult,
+                           old_peertube_id: Optional[str] = None) -> Optional['PeerTubeUploadResult']:
+        """
+        Upload a single video to PeerTube and add it to its course playlist
 
-                if not playlist_id:
-                    print(f"  Creating playlist: {playlist_title}")
-                    playlist_id = self.youtube_uploader.create_playlist(
-                        title=playlist_title,
-                        description=f"Videos for {playlist_title}",
-                        privacy="unlisted"
-                    )
+        Args:
+            metadata: Video metadata (peertube_id is updated on success)
+            video_path: Path to video file
+            result: UploadResult to fill with the PeerTube status
+            old_peertube_id: Previous PeerTube video to delete before uploading
 
-                if playlist_id:
-                    self.youtube_uploader.add_video_to_playlist(playlist_id, yt_result.video_id)
-            else:
-                print(f"  ❌ YouTube: {yt_result.error}")
+        Returns:
+            Result of the upload, or None if no PeerTube uploader is configured
+        """
+        if not self.peertube_uploader:
+            return None
+
+        if old_peertube_id:
+            _log(f"  [{metadata.filename}] Deleting old PeerTube video...")
+            self.peertube_uploader.delete_video(old_peertube_id)
+
+        # Append footer to description for upload
+        full_description = f"{metadata.description}{MetadataExtractor.get_description_footer()}"
+
+        _log(f"  [{metadata.filename}] Uploading to PeerTube...")
+        pt_result = self.peertube_uploader.upload_video(
+            video_path=video_path,
+            title=metadata.title,
+            description=full_description,
+            privacy=2,  # Unlisted
+            auto_thumbnail=True  # Set thumbnail at 4 seconds
+        )
+
+        result.peertube_success = pt_result.success
+        result.peertube_url = pt_result.video_url
+        result.peertube_error = pt_result.error
+
+        if not pt_result.success:
+            _log(f"  [{metadata.filename}] ❌ PeerTube: {pt_result.error}")
+            return pt_result
+
+        _log(f"  [{metadata.filename}] ✅ PeerTube: {pt_result.video_url}")
+        # Update metadata with PeerTube ID
+        metadata.peertube_id = pt_result.video_id
+
+        # Add to playlist
+        playlist_name = metadata.description  # Use base description as playlist name
 
-        # Upload to PeerTube
-        if upload_to_peertube and self.peertube_uploader:
-            print(f"  Uploading to PeerTube...")
-            pt_result = self.peertube_uploader.upload_video(
-                video_path=video_path,
+        with self._peertube_playlist_lock:
+            _log(f"  [{metadata.filename}] Checking for playlist: {playlist_name}")
+            playlist_id = self.peertube_uploader.get_playlist_by_name(playlist_name)
+
+            if not playlist_id:
+                _log(f"  [{metadata.filename}] Creating playlist: {playlist_name}")
+                playlist_id = self.peertube_uploader.create_playlist(
+                    display_name=playlist_name,
+                    description=f"Videos for {playlist_name}",
+                    privacy=2  # Unlisted
+                )
+
+        if playlist_id:
+            self.peertube_uploader.add_video_to_playlist(playlist_id, pt_result.video_id)
+
+        return pt_result
+
+    def plan_upload(self, video_folder: Path, metadata: VideoMetadata,
+                    metadata_manager,
+                    upload_to_youtube: bool = True,
+                    upload_to_peertube: bool = True,
+                    peertube_only_mode: bool = False,
+                    planned_hashes: Optional[Set[str]] = None) -> UploadPlan:
+        """
+        Decide what has to be uploaded for a video, without touching the platforms
+
+        Args:
+            video_folder: Folder containing video files
+            metadata: Video metadata for the new video
+            metadata_manager: MetadataManager instance for checking existing uploads
+            upload_to_youtube: Whether to upload to YouTube
+            upload_to_peertube: Whether to upload to PeerTube
+            peertube_only_mode: If True, only consider PeerTube for all decisions (ignore YouTube entirely)
+            planned_hashes: Hashes already planned for upload in this batch; when all
+                            videos are planned before uploading, a second file with the
+                            same content is skipped instead of uploaded twice (updated in place)
+
+        Returns:
+            UploadPlan for the video (with skip_result set if nothing has to be uploaded)
+        """
+        _log(f"  Title: {metadata.title}")
+
+        video_path = video_folder / metadata.filename
+        plan = UploadPlan(metadata=metadata, video_path=video_path)
+
+        if not video_path.exists():
+            _log(f"  ❌ Video file not found: {video_path}")
+            plan.skip_result = UploadResult(
+                filename=metadata.filename,
                 title=metadata.title,
-                description=full_description,
-                privacy=2,  # Unlisted
-                auto_thumbnail=True  # Set thumbnail at 4 seconds
+                youtube_success=False,
+                youtube_error="File not found",
+                peertube_success=False,
+                peertube_error="File not found"
             )
+            return plan
+
+        # Priority 1: Check for content replacement (same course+part+chapter+language but different hash)
+        existing_entry = metadata_manager.find_by_course_part_chapter_language(
+            metadata.course_index,
+            metadata.part_index,
+            metadata.chapter_index,
+            metadata.code_language
+        )
+
+        if existing_entry and existing_entry.sha256_hash != metadata.sha256_hash:
+            # Found existing video with same course+part+chapter+language but different content
+            _log(f"  🔄 Replacing existing video (content changed)")
+            _log(f"    Old: {existing_entry.filename} (hash: {existing_entry.sha256_hash[:16]}...)")
+            _log(f"    New: {metadata.filename} (hash: {metadata.sha256_hash[:16]}...)")
+
+            plan.upload_to_youtube = upload_to_youtube and not peertube_only_mode
+            plan.upload_to_peertube = upload_to_peertube
+
+            # Remember existing IDs so the old videos get deleted (respect peertube_only_mode)
+            if plan.upload_to_youtube and self.youtube_uploader:
+                plan.old_youtube_id = existing_entry.youtube_id
+            if plan.upload_to_peertube and self.peertube_uploader:
+                plan.old_peertube_id = existing_entry.peertube_id
+
+        # Priority 2: Check if hash exists in metadata.json
+        elif metadata.sha256_hash:
+            existing_by_hash = metadata_manager.find_by_hash(metadata.sha256_hash)
+
+            if planned_hashes is not None and metadata.sha256_hash in planned_hashes:
+                # Same content as a video planned earlier in this batch, which is not
+                # in metadata.json yet: it gets uploaded once, by that video
+                _log(f"  ⏭️  Skipping (same content as a video already planned in this batch)")
+                plan.skip_result = UploadResult(
+                    filename=metadata.filename,
+                    title=metadata.title,
+                    youtube_success=False,
+                    youtube_error="Duplicate in batch" if not peertube_only_mode else "PeerTube-only mode",
+                    peertube_success=False,
+                    peertube_error="Duplicate in batch"
+                )
+
+            elif not existing_by_hash:
+                # New video (hash not found)
+                _log(f"  📤 New video (hash not found in metadata.json)")
+                plan.upload_to_youtube = upload_to_youtube and not peertube_only_mode
+                plan.upload_to_peertube = upload_to_peertube
 
-            result.peertube_success = pt_result.success
-            result.peertube_url = pt_result.video_url
-            result.peertube_error = pt_result.error
+            else:
+                # Priority 3: Hash exists - check which platforms need upload
+                if peertube_only_mode:
+                    # In PeerTube-only mode, only check PeerTube status
+                    need_youtube = False
+                    need_peertube = upload_to_peertube and not existing_by_hash.peertube_id
+                else:
+                    # Normal mode: check both platforms
+                    need_youtube = upload_to_youtube and not existing_by_hash.youtube_id
+                    need_peertube = upload_to_peertube and not existing_by_hash.peertube_id
 
-            if pt_result.success:
-                print(f"  ✅ PeerTube: {pt_result.video_url}")
-                # Update metadata with PeerTube ID
-                metadata.peertube_id = pt_result.video_id
+                # Copy existing IDs to preserve already uploaded platforms
+                metadata.youtube_id = existing_by_hash.youtube_id
+                metadata.peertube_id = existing_by_hash.peertube_id
 
-                # Add to playlist
-                playlist_name = metadata.description  # Use base description as playlist name
-                print(f"  Checking for playlist: {playlist_name}")
+                if need_youtube or need_peertube:
+                    _log(f"  📤 Duplicate content (same hash as {existing_by_hash.filename})")
 
-                playlist_id = self.peertube_uploader.get_playlist_by_name(playlist_name)
+                    if peertube_only_mode:
+                        _log(f"    Uploading to PeerTube only (PeerTube-only mode)")
+                    elif need_youtube and not need_peertube:
+                        _log(f"    Uploading to YouTube only (PeerTube already has it)")
+                    elif need_peertube and not need_youtube:
+                        _log(f"    Uploading to PeerTube only (YouTube already has it)")
+                    else:
+                        _log(f"    Uploading to both platforms")
 
-                if not playlist_id:
-                    print(f"  Creating playlist: {playlist_name}")
-                    playlist_id = self.peertube_uploader.create_playlist(
-                        display_name=playlist_name,
-                        description=f"Videos for {playlist_name}",
-                        privacy=2  # Unlisted
+                    plan.upload_to_youtube = need_youtube
+                    plan.upload_to_peertube = need_peertube
+                else:
+                    # Check skip message based on mode
+                    if peertube_only_mode:
+                        skip_msg = "already uploaded to PeerTube"
+                    else:
+                        skip_msg = "already uploaded to both platforms"
+
+                    _log(f"  ⏭️  Skipping ({skip_msg})")
+                    _log(f"    Same content as: {existing_by_hash.filename}")
+
+                    plan.skip_result = UploadResult(
+                        filename=metadata.filename,
+                        title=metadata.title,
+                        youtube_success=False,
+                        youtube_error="Already uploaded" if not peertube_only_mode else "PeerTube-only mode",
+                        peertube_success=False,
+                        peertube_error="Already uploaded"
                     )
 
-                if playlist_id:
-                    self.peertube_uploader.add_video_to_playlist(playlist_id, pt_result.video_id)
-            else:
-                print(f"  ❌ PeerTube: {pt_result.error}")
+        else:
+            # No hash available (shouldn't happen in normal flow)
+            _log(f"  ⚠️  No hash available, uploading anyway")
+            plan.upload_to_youtube = upload_to_youtube and not peertube_only_mode
+            plan.upload_to_peertube = upload_to_peertube
 
-        return result
+        if planned_hashes is not None and metadata.sha256_hash and (plan.upload_to_youtube or plan.upload_to_peertube):
+            planned_hashes.add(metadata.sha256_hash)
+
+        return plan
+
+    def update_course_ymls(self, metadata_list: List[VideoMetadata]):
+        """
+        Update course.yml for several uploaded videos, writing each course.yml once
+
+        Args:
+            metadata_list: Video metadata with updated platform IDs
+        """
+        if self.course_yml_updater and metadata_list:
+            _log(f"\nUpdating course.yml for {len(metadata_list)} videos...")
+            self.course_yml_updater.update_video_ids_batch(metadata_list)
 
     def upload_batch(self, video_folder: Path, metadata_list: List[VideoMetadata],
                      metadata_manager,
@@ -194,156 +431,53 @@ class UploadOrchestrator:
             List of UploadResult for each video
         """
         results = []
+        uploaded = []
+        # Content already planned in this batch, so duplicates are uploaded once
+        planned_hashes = set()
 
-        for i, metadata in enumerate(metadata_list, 1):
-            print(f"\n[{i}/{len(metadata_list)}] Processing: {metadata.filename}")
-            print(f"  Title: {metadata.title}")
+        try:
+            for i, metadata in enumerate(metadata_list, 1):
+                _log(f"\n[{i}/{len(metadata_list)}] Processing: {metadata.filename}")
 
-            video_path = video_folder / metadata.filename
+                plan = self.plan_upload(
+                    video_folder=video_folder,
+                    metadata=metadata,
+                    metadata_manager=metadata_manager,
+                    upload_to_youtube=upload_to_youtube,
+                    upload_to_peertube=upload_to_peertube,
+                    peertube_only_mode=peertube_only_mode,
+                    planned_hashes=planned_hashes
+                )
+
+                if plan.skip_result:
+                    results.append(plan.skip_result)
+                    continue
 
-            if not video_path.exists():
-                print(f"  ❌ Video file not found: {video_path}")
-                results.append(UploadResult(
+                result = UploadResult(
                     filename=metadata.filename,
                     title=metadata.title,
                     youtube_success=False,
-                    youtube_error="File not found",
-                    peertube_success=False,
-                    peertube_error="File not found"
-                ))
-                continue
-
-            # Priority 1: Check for content replacement (same course+part+chapter+language but different hash)
-            existing_entry = metadata_manager.find_by_course_part_chapter_language(
-                metadata.course_index,
-                metadata.part_index,
-                metadata.chapter_index,
-                metadata.code_language
-            )
-
-            if existing_entry and existing_entry.sha256_hash != metadata.sha256_hash:
-                # Found existing video with same course+part+chapter+language but different content
-                print(f"  🔄 Replacing existing video (content changed)")
-                print(f"    Old: {existing_entry.filename} (hash: {existing_entry.sha256_hash[:16]}...)")
-                print(f"    New: {metadata.filename} (hash: {metadata.sha256_hash[:16]}...)")
-
-                # Copy existing IDs before replacing (so we can delete them)
-                old_youtube_id = existing_entry.youtube_id
-                old_peertube_id = existing_entry.peertube_id
-
-                # Delete old videos from platforms (respect peertube_only_mode)
-                if not peertube_only_mode and old_youtube_id and upload_to_youtube and self.youtube_uploader:
-                    print(f"  Deleting old YouTube video...")
-                    self.youtube_uploader.delete_video(old_youtube_id)
-
-                if old_peertube_id and upload_to_peertube and self.peertube_uploader:
-                    print(f"  Deleting old PeerTube video...")
-                    self.peertube_uploader.delete_video(old_peertube_id)
-
-                # Upload new video to configured platforms
-                result = self.upload_video(
-                    video_path=video_path,
-                    metadata=metadata,
-                    upload_to_youtube=upload_to_youtube and not peertube_only_mode,
-                    upload_to_peertube=upload_to_peertube,
-                    replace_existing=False  # Already deleted manually
+                    peertube_success=False
                 )
 
-            # Priority 2: Check if hash exists in metadata.json
-            elif metadata.sha256_hash:
-                existing_by_hash = metadata_manager.find_by_hash(metadata.sha256_hash)
-
-                if not existing_by_hash:
-                    # New video (hash not found)
-                    print(f"  📤 New video (hash not found in metadata.json)")
-                    result = self.upload_video(
-                        video_path=video_path,
-                        metadata=metadata,
-                        upload_to_youtube=upload_to_youtube and not peertube_only_mode,
-                        upload_to_peertube=upload_to_peertube,
-                        replace_existing=False
-                    )
+                if plan.upload_to_youtube:
+                    self.upload_to_youtube(metadata, plan.video_path, result, plan.old_youtube_id)
 
-                else:
-                    # Priority 3: Hash exists - check which platforms need upload
-                    if peertube_only_mode:
-                        # In PeerTube-only mode, only check PeerTube status
-                        need_youtube = False
-                        need_peertube = upload_to_peertube and not existing_by_hash.peertube_id
-                    else:
-                        # Normal mode: check both platforms
-                        need_youtube = upload_to_youtube and not existing_by_hash.youtube_id
-                        need_peertube = upload_to_peertube and not existing_by_hash.peertube_id
-
-                    if need_youtube or need_peertube:
-                        print(f"  📤 Duplicate content (same hash as {existing_by_hash.filename})")
-
-                        # Copy existing IDs to preserve already uploaded platforms
-                        metadata.youtube_id = existing_by_hash.youtube_id
-                        metadata.peertube_id = existing_by_hash.peertube_id
-
-                        if peertube_only_mode:
-                            print(f"    Uploading to PeerTube only (PeerTube-only mode)")
-                        elif need_youtube and not need_peertube:
-                            print(f"    Uploading to YouTube only (PeerTube already has it)")
-                        elif need_peertube and not need_youtube:
-                            print(f"    Uploading to PeerTube only (YouTube already has it)")
-                        else:
-                            print(f"    Uploading to both platforms")
-
-                        result = self.upload_video(
-                            video_path=video_path,
-                            metadata=metadata,
-                            upload_to_youtube=need_youtube,
-                            upload_to_peertube=need_peertube,
-                            replace_existing=False
-                        )
-                    else:
-                        # Check skip message based on mode
-                        if peertube_only_mode:
-                            skip_msg = "already uploaded to PeerTube"
-                        else:
-                            skip_msg = "already uploaded to both platforms"
-
-                        print(f"  ⏭️  Skipping ({skip_msg})")
-                        print(f"    Same content as: {existing_by_hash.filename}")
-
-                        # Copy existing IDs
-                        metadata.youtube_id = existing_by_hash.youtube_id
-                        metadata.peertube_id = existing_by_hash.peertube_id
-
-                        results.append(UploadResult(
-                            filename=metadata.filename,
-                            title=metadata.title,
-                            youtube_success=False,
-                            youtube_error="Already uploaded" if not peertube_only_mode else "PeerTube-only mode",
-                            peertube_success=False,
-                            peertube_error="Already uploaded"
-                        ))
-                        continue
+                if plan.upload_to_peertube:
+                    self.upload_to_peertube(metadata, plan.video_path, result, plan.old_peertube_id)
 
-            else:
-                # No hash available (shouldn't happen in normal flow)
-                print(f"  ⚠️  No hash available, uploading anyway")
-                result = self.upload_video(
-                    video_path=video_path,
-                    metadata=metadata,
-                    upload_to_youtube=upload_to_youtube and not peertube_only_mode,
-                    upload_to_peertube=upload_to_peertube,
-                    replace_existing=False
-                )
-
-            results.append(result)
+                results.append(result)
 
-            # Update metadata.json after each successful upload
-            if result.youtube_success or result.peertube_success:
-                metadata_manager.update_metadata(metadata)
+                if result.youtube_success or result.peertube_success:
+                    # Journal the video's metadata after each successful upload
+                    metadata_manager.append(metadata)
+                    uploaded.append(metadata)
+        finally:
+            # Single metadata.json rewrite for the whole batch, even if interrupted
+            if uploaded:
                 metadata_manager.save(list(metadata_manager.metadata_dict.values()))
-
-                # Update course.yml if updater is configured
-                if self.course_yml_updater:
-                    print(f"  Updating course.yml...")
-                    self.course_yml_updater.update_video_ids(metadata)
+            # Each course.yml is rewritten once for all of its uploaded videos
+            self.update_course_ymls(uploaded)
 
         return results
 
@@ -357,27 +491,27 @@ class UploadOrchestrator:
         auth_status = {}
 
         if self.youtube_uploader:
-            print("Authenticating with YouTube...")
+            _log("Authenticating with YouTube...")
             try:
                 auth_status['youtube'] = self.youtube_uploader.authenticate()
                 if auth_status['youtube']:
-                    print("✅ YouTube authentication successful")
+                    _log("✅ YouTube authentication successful")
                 else:
-                    print("❌ YouTube authentication failed")
+                    _log("❌ YouTube authentication failed")
             except Exception as e:
-                print(f"❌ YouTube authentication error: {e}")
+                _log(f"❌ YouTube authentication error: {e}")
                 auth_status['youtube'] = False
 
         if self.peertube_uploader:
-            print("Authenticating with PeerTube...")
+            _log("Authenticating with PeerTube...")
             try:
                 auth_status['peertube'] = self.peertube_uploader.authenticate()
                 if auth_status['peertube']:
-                    print("✅ PeerTube authentication successful")
+                    _log("✅ PeerTube authentication successful")
                 else:
-                    print("❌ PeerTube authentication failed")
+                    _log("❌ PeerTube authentication failed")
             except Exception as e:
-                print(f"❌ PeerTube authentication error: {e}")
+                _log(f"❌ PeerTube authentication error: {e}")
                 auth_status['peertube'] = False
 
         return auth_status
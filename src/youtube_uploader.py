@@ -1,5 +1,6 @@
 import os
 import pickle
+import threading
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
@@ -34,7 +35,24 @@ class YouTubeUploader:
         """
         self.client_secrets_file = client_secrets_file
         self.credentials_file = credentials_file
-        self.youtube = None
+        self.credentials = None
+        self._local = threading.local()
+
+    @property
+    def youtube(self):
+        """
+        YouTube API client for the calling thread
+
+        The underlying httplib2 transport is not thread-safe, so every thread
+        that uploads gets its own client built from the shared credentials.
+        """
+        if not self.credentials:
+            return None
+
+        if getattr(self._local, 'youtube', None) is None:
+            self._local.youtube = build('youtube', 'v3', credentials=self.credentials)
+
+        return self._local.youtube
 
     def authenticate(self):
         """Authenticate with YouTube API using OAuth2"""
@@ -58,7 +76,8 @@ class YouTubeUploader:
             with open(self.credentials_file, 'wb') as token:
                 pickle.dump(creds, token)
 
-        self.youtube = build('youtube', 'v3', credentials=creds)
+        self.credentials = creds
+        self._local = threading.local()
         return True
 
     def get_playlist_by_title(self, title: str) -> Optional[str]:
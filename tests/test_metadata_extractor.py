@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.metadata_extractor import MetadataExtractor
+from src.metadata_manager import MetadataManager
+
+COURSE_MD = """---
+name: Course
+---
+# Part
+<partId>p1</partId>
+## Chapter
+<chapterId>c1</chapterId>
+:::video id=video-uuid:::
+"""
+
+
+class ProcessVideosInFolderTest(unittest.TestCase):
+    """Reuse of metadata.json records and cached hashes by process_videos_in_folder"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        (root / 'bec' / 'courses' / 'btc101').mkdir(parents=True)
+        md_file = root / 'bec' / 'courses' / 'btc101' / 'en.md'
+        md_file.write_text(COURSE_MD, encoding='utf-8')
+        os.utime(md_file, (1_000_000, 1_000_000))
+        self.root = root
+        self.manager = MetadataManager(root / 'metadata.json')
+        self.hash_cache_file = root / '.hash_cache.json'
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmp.cleanup()
+
+    def write_video(self, folder: str, content: bytes, mtime: int) -> Path:
+        video_file = self.root / folder / 'btc101_1.1_en.mp4'
+        video_file.parent.mkdir(exist_ok=True)
+        video_file.write_bytes(content)
+        os.utime(video_file, (mtime, mtime))
+        return video_file
+
+    def process(self, folder: str):
+        """One run of main: load both caches, extract, persist both caches"""
+        self.manager.load()
+        extractor = MetadataExtractor(str(self.root / 'bec'))
+        extractor.load_hash_cache(self.hash_cache_file)
+        metadata_list = extractor.process_videos_in_folder(
+            self.root / folder,
+            cache=self.manager.metadata_dict,
+            cache_mtime=self.manager.loaded_mtime,
+            max_workers=1
+        )
+        extractor.save_hash_cache(self.hash_cache_file)
+        self.manager.save(metadata_list)
+        return metadata_list
+
+    def test_same_filename_in_other_folder_is_hashed(self):
+        self.write_video('first', b'first video', mtime=2_000_000)
+        self.process('first')
+
+        other = self.write_video('second', b'other video!', mtime=1_500_000)
+        metadata, = self.process('second')
+
+        self.assertEqual(metadata.sha256_hash, MetadataExtractor.calculate_file_hash(other))
+
+    def test_unchanged_video_reuses_record(self):
+        video_file = self.write_video('first', b'first video', mtime=2_000_000)
+        self.process('first')
+
+        metadata, = self.process('first')
+
+        self.assertEqual(metadata.sha256_hash, MetadataExtractor.calculate_file_hash(video_file))
+        self.assertEqual(metadata.video_id, 'video-uuid')
+
+    def test_record_hash_reused_only_for_same_size_and_mtime(self):
+        self.write_video('first', b'first video', mtime=2_000_000)
+        self.process('first')
+        self.hash_cache_file.unlink()
+
+        with mock.patch.object(MetadataExtractor, 'calculate_file_hash',
+                               side_effect=AssertionError("unchanged video hashed again")):
+            self.process('first')
+
+        self.hash_cache_file.unlink()
+        changed = self.write_video('first', b'other video!', mtime=1_500_000)
+        metadata, = self.process('first')
+
+        self.assertEqual(metadata.sha256_hash, MetadataExtractor.calculate_file_hash(changed))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+from main import upload_concurrently
+from src.metadata_extractor import VideoMetadata
+from src.metadata_manager import MetadataManager
+from src.rate_limiter import AdaptiveConcurrencyLimiter, TokenBucket
+from src.upload_orchestrator import UploadOrchestrator
+
+
+class FakeUploader:
+    """Records uploads; serves both the YouTube and the PeerTube uploader interface"""
+
+    def __init__(self, platform: str):
+        self.platform = platform
+        self.uploaded = []
+
+    def upload_video(self, video_path, title, description, **kwargs):
+        self.uploaded.append(video_path.name)
+        video_id = f"{self.platform}-{len(self.uploaded)}"
+        return SimpleNamespace(success=True, video_id=video_id, video_url=f"https://{self.platform}/{video_id}",
+                               error=None, overloaded=False)
+
+    def get_playlist_by_title(self, title):
+        return "playlist"
+
+    get_playlist_by_name = get_playlist_by_title
+
+    def add_video_to_playlist(self, playlist_id, video_id):
+        return True
+
+
+def make_metadata(filename: str, sha256_hash: str, chapter_index: int = 1, **ids) -> VideoMetadata:
+    return VideoMetadata(
+        filename=filename, course_index='btc101', part_index=1, chapter_index=chapter_index,
+        code_language='en', title=f"[BTC 101] - 1.{chapter_index} - Chapter", description='BTC 101 - Course',
+        chapter_title='Chapter', course_title='Course', sha256_hash=sha256_hash, **ids
+    )
+
+
+class UploadConcurrentlyTest(unittest.TestCase):
+    """Upload planning of upload_concurrently, with fake platform uploaders"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp.name)
+        self.manager = MetadataManager(self.folder / 'metadata.json')
+        self.youtube = FakeUploader('youtube')
+        self.peertube = FakeUploader('peertube')
+        self.orchestrator = UploadOrchestrator(youtube_uploader=self.youtube, peertube_uploader=self.peertube)
+
+    def tearDown(self):
+        self.manager.close()
+        self.tmp.cleanup()
+
+    def upload(self, metadata_list, upload_to_youtube: bool, upload_to_peertube: bool):
+        for metadata in metadata_list:
+            (self.folder / metadata.filename).write_bytes(b'video')
+        return upload_concurrently(
+            orchestrator=self.orchestrator,
+            video_folder=self.folder,
+            metadata_list=metadata_list,
+            metadata_manager=self.manager,
+            upload_to_youtube=upload_to_youtube,
+            upload_to_peertube=upload_to_peertube,
+            peertube_only_mode=False,
+            youtube_workers=2,
+            peertube_workers=2,
+            youtube_limiter=TokenBucket(rate=1000, burst=2),
+            peertube_limiter=AdaptiveConcurrencyLimiter(max_concurrency=2)
+        )
+
+    def test_youtube_only_skips_video_already_on_youtube(self):
+        self.manager.update_metadata(make_metadata('old.mp4', 'a' * 64, youtube_id='yt-old'))
+
+        results = self.upload([make_metadata('new.mp4', 'a' * 64, chapter_index=2)],
+                              upload_to_youtube=True, upload_to_peertube=False)
+
+        self.assertEqual(self.youtube.uploaded, [])
+        self.assertEqual(self.peertube.uploaded, [])
+        self.assertEqual(results[0].youtube_error, "Already uploaded")
+
+    def test_peertube_only_never_uploads_to_youtube(self):
+        results = self.upload([make_metadata('new.mp4', 'b' * 64)],
+                              upload_to_youtube=False, upload_to_peertube=True)
+
+        self.assertEqual(self.youtube.uploaded, [])
+        self.assertEqual(self.peertube.uploaded, ['new.mp4'])
+        self.assertTrue(results[0].peertube_success)
+        self.assertFalse(results[0].youtube_success)
+
+    def test_duplicate_content_in_batch_is_uploaded_once(self):
+        results = self.upload([make_metadata('a.mp4', 'c' * 64), make_metadata('b.mp4', 'c' * 64, chapter_index=2)],
+                              upload_to_youtube=True, upload_to_peertube=True)
+
+        self.assertEqual(self.youtube.uploaded, ['a.mp4'])
+        self.assertEqual(self.peertube.uploaded, ['a.mp4'])
+        self.assertEqual(results[1].peertube_error, "Duplicate in batch")
+
+
+if __name__ == '__main__':
+    unittest.main()